@@ -0,0 +1,108 @@
+"""
+Split and dividend adjustment of daily price history.
+
+Adjusted closes are computed locally from raw daily records and corporate
+action events, e.g. from filter_splits and filter_dividends. Each event
+scales the closes before its ex-date: a split by one over its coefficient
+and a dividend by one minus the amount over the previous close.
+"""
+
+from bisect import bisect_left
+
+from alphavantage.price_history import DATE
+from alphavantage.reference import (
+    ADJUSTED_CLOSE, CLOSE, DIVIDEND, SPLIT_COEFFICIENT
+)
+from alphavantage.results import Results
+
+
+class Adjustments:
+    """Cumulative adjustment factors of time ascending daily records.
+
+    Factors are computed in one reverse pass and updated in place for the
+    records before an event added later.
+    """
+
+    def __init__(self, records, splits=(), dividends=()):
+        self.records = list(records)
+        self.times = [record[DATE] for record in self.records]
+        self.splits = dict(splits)
+        self.dividends = dict(dividends)
+        self.factors = self.compute_factors()
+
+    def compute_factors(self):
+        """Product of the factors of events after each record."""
+
+        events = [1.0] * (len(self.records) + 1)
+
+        for day, coefficient in self.splits.items():
+            events[self.index(day)] /= coefficient
+
+        for day, amount in self.dividends.items():
+            index = self.index(day)
+            events[index] *= self.dividend_factor(index, amount)
+
+        factors = [1.0] * len(self.records)
+        factor = events[-1]
+
+        for index in range(len(self.records) - 1, -1, -1):
+            factors[index] = factor
+            factor *= events[index]
+
+        return factors
+
+    def index(self, day):
+        """Index of the first record on or after day."""
+
+        return bisect_left(self.times, day)
+
+    def dividend_factor(self, index, amount):
+        if index == 0:
+            return 1.0
+
+        return 1 - amount / self.records[index - 1][CLOSE]
+
+    def scale(self, day, factor):
+        for index in range(self.index(day)):
+            self.factors[index] *= factor
+
+    def add_split(self, day, coefficient):
+        """Adjust the records before day for a new split."""
+
+        self.splits[day] = self.splits.get(day, 1.0) * coefficient
+        self.scale(day, 1 / coefficient)
+
+    def add_dividend(self, day, amount):
+        """Adjust the records before day for a new dividend."""
+
+        self.dividends[day] = self.dividends.get(day, 0.0) + amount
+        self.scale(day, self.dividend_factor(self.index(day), amount))
+
+    def append(self, records):
+        """Add records newer than the current records."""
+
+        for record in records:
+            self.records.append(record)
+            self.times.append(record[DATE])
+            self.factors.append(1.0)
+
+    def adjusted_records(self):
+        """Records with the fields of AdjustedPriceHistory records."""
+
+        for record, factor in zip(self.records, self.factors):
+            adjusted = dict(record)
+            adjusted[ADJUSTED_CLOSE] = record[CLOSE] * factor
+            adjusted[DIVIDEND] = self.dividends.get(record[DATE], 0.0)
+            adjusted[SPLIT_COEFFICIENT] = self.splits.get(record[DATE], 1.0)
+
+            yield adjusted
+
+
+def adjust(results: Results, splits=(), dividends=()) -> Results:
+    """Adjust daily results for (date, value) split and dividend events."""
+
+    adjustments = Adjustments(results.records, splits, dividends)
+
+    return Results(results.ticker, list(adjustments.adjusted_records()),
+                   results.timezone, updated_at=results.updated_at,
+                   retrieved_at=results.retrieved_at)
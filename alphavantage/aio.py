@@ -0,0 +1,244 @@
+"""
+Asyncio Alpha Vantage API Adapter.
+
+Requires aiohttp, installed with the ``async`` extra.
+"""
+
+import asyncio
+from datetime import datetime
+
+try:
+    import aiohttp
+    CLIENT_ERRORS = (aiohttp.ClientError,)
+    CONNECTION_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+except ImportError:  # pragma: no cover
+    aiohttp = None
+    CLIENT_ERRORS = ()
+    CONNECTION_ERRORS = (asyncio.TimeoutError,)
+
+from alphavantage.cache import ResponseCache
+from alphavantage.decoding import DECODER, Decoder
+from alphavantage.exceptions import ThrottledError
+from alphavantage.instrumentation import (
+    CACHE_HIT, DECODE, NULL_INSTRUMENTATION, PAYLOAD_BYTES, RATE_LIMIT_WAIT,
+    REQUEST, Instrumentation
+)
+from alphavantage.price_history import (
+    COMPACT, FULL, AdjustedPriceHistory, IntradayPriceHistory, PriceHistory
+)
+from alphavantage.rate_limit import RATE_LIMITER, RateLimiter
+from alphavantage.reference import BASE_URL
+from alphavantage.retry import REQUEST_ERRORS, Outcome, RetryPolicy
+from alphavantage.retry import is_transient as is_request_transient
+
+
+def is_transient(error: Exception) -> bool:
+    """Check if a failed request may succeed when retried."""
+
+    if aiohttp is not None and isinstance(error, aiohttp.ClientResponseError):
+        return error.status == 429 or error.status >= 500
+
+    return isinstance(error, CONNECTION_ERRORS) or is_request_transient(error)
+
+
+def create_session():
+    """Create an aiohttp client session."""
+
+    if aiohttp is None:
+        raise ImportError(
+            'aiohttp is required for the asyncio client: '
+            'pip install alphavantage[async]'
+        )
+
+    return aiohttp.ClientSession()
+
+
+async def get(session, parameters=None, url=BASE_URL,
+              limiter: RateLimiter = RATE_LIMITER, cache: ResponseCache = None,
+              instrumentation: Instrumentation = NULL_INSTRUMENTATION,
+              decoder: Decoder = DECODER):
+    """Request data as JSON, decoded from the undecoded body by decoder."""
+
+    body, retrieved_at = await fetch(session, parameters, url, limiter, cache,
+                                     instrumentation)
+
+    with instrumentation.timed(DECODE, (parameters or {}).get('symbol')):
+        data = decoder(body)
+
+    return data, retrieved_at
+
+
+async def fetch(session, parameters=None, url=BASE_URL,
+                limiter: RateLimiter = RATE_LIMITER, cache: ResponseCache = None,
+                instrumentation: Instrumentation = NULL_INSTRUMENTATION):
+    """Request the undecoded response body.
+
+    Cache reads and writes block on SQLite, so they run in the default
+    executor to keep other requests on the loop going.
+    """
+
+    ticker = (parameters or {}).get('symbol')
+    loop = asyncio.get_event_loop()
+
+    if cache is not None:
+        cached = await loop.run_in_executor(None, cache.get, parameters)
+        instrumentation.emit(CACHE_HIT, int(cached is not None), ticker)
+
+        if cached is not None:
+            return cached
+
+    delay = limiter.reserve()
+    instrumentation.emit(RATE_LIMIT_WAIT, delay, ticker)
+
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+    with instrumentation.timed(REQUEST, ticker):
+        async with session.get(url, params=parameters) as response:
+            response.raise_for_status()
+            body = await response.read()
+
+    retrieved_at = datetime.utcnow()
+    instrumentation.emit(PAYLOAD_BYTES, len(body), ticker)
+
+    if cache is not None:
+        await loop.run_in_executor(None, cache.set, parameters, body,
+                                   retrieved_at)
+
+    return body, retrieved_at
+
+
+class AsyncMixin:
+    """Replace blocking requests with coroutines on an aiohttp session."""
+
+    def create_session(self):
+        """Sessions are created per request unless one is given."""
+
+        return None
+
+    async def get(self, ticker):
+        parameters = self.request_parameters(ticker)
+
+        if self.single_flight is None:
+            return await self.request(ticker, parameters)
+
+        return await self.single_flight.call_async(
+            self.coalesce_key(parameters), self.request, ticker, parameters
+        )
+
+    async def request(self, ticker, parameters):
+        parameters = dict(parameters)
+        limiter = self.get_limiter(parameters)
+
+        try:
+            body, retrieved_at = await self.fetch(ticker, parameters, limiter)
+
+            return self.parse_body(ticker, body, retrieved_at)
+        except ThrottledError as error:
+            self.report_throttle(limiter, error)
+            raise
+
+    async def fetch(self, ticker, parameters=None, limiter=None):
+        """Request the undecoded response body and its retrieval time."""
+
+        if parameters is None:
+            parameters = self.request_parameters(ticker)
+
+        if limiter is None:
+            limiter = self.get_limiter(parameters)
+
+        if self.session is not None:
+            return await fetch(self.session, parameters, limiter=limiter,
+                               cache=self.cache,
+                               instrumentation=self.instrumentation)
+
+        async with create_session() as session:
+            return await fetch(session, parameters, limiter=limiter,
+                               cache=self.cache,
+                               instrumentation=self.instrumentation)
+
+    async def sync(self, ticker, results):
+        """Merge the latest compact response into stored results."""
+
+        parameters = self.request_parameters(ticker)
+        parameters['outputsize'] = COMPACT
+        latest = await self.request(ticker, parameters)
+
+        if self.requires_full_history(results.records, latest.records):
+            return await self.request(ticker, dict(parameters, outputsize=FULL))
+
+        return self.merge_latest(ticker, results, latest)
+
+    def stream(self, ticker):
+        raise NotImplementedError(
+            f'{type(self).__name__} does not stream responses, use get'
+        )
+
+
+class AsyncPriceHistory(AsyncMixin, PriceHistory):
+    """Price history on an event loop."""
+
+
+class AsyncAdjustedPriceHistory(AsyncMixin, AdjustedPriceHistory):
+    """Adjusted price history on an event loop."""
+
+
+class AsyncIntradayPriceHistory(AsyncMixin, IntradayPriceHistory):
+    """Intraday price history on an event loop."""
+
+
+async def get_results(cls: AsyncMixin, tickers: list, parameters: dict,
+                      max_concurrency=4, session=None, retry: RetryPolicy = None):
+    """Yield multiple results as they complete, bounding requests in flight.
+
+    Tickers failing after retries are skipped, see get_outcomes.
+    """
+
+    outcomes = get_outcomes(cls, tickers, parameters, max_concurrency, session,
+                            retry)
+
+    async for outcome in outcomes:
+        if outcome.ok:
+            yield outcome.ticker, outcome.results
+
+
+async def get_outcomes(cls: AsyncMixin, tickers: list, parameters: dict,
+                       max_concurrency=4, session=None, retry: RetryPolicy = None,
+                       sleep=asyncio.sleep):
+    """Yield an Outcome with results or the final error for each ticker.
+
+    Throttled and transient failures are retried with backoff, without
+    holding a request slot while waiting.
+    """
+
+    if session is None:
+        async with create_session() as session:
+            async for outcome in get_outcomes(cls, tickers, parameters,
+                                              max_concurrency, session, retry,
+                                              sleep):
+                yield outcome
+        return
+
+    history = cls(session=session, **parameters)
+    retry = RetryPolicy() if retry is None else retry
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(ticker):
+        attempt = 1
+
+        while True:
+            async with semaphore:
+                try:
+                    return Outcome(ticker, await history.get(ticker),
+                                   attempts=attempt)
+                except CLIENT_ERRORS + CONNECTION_ERRORS + REQUEST_ERRORS as error:
+                    failure = error
+
+            if not retry.should_retry(failure, attempt, is_transient):
+                return Outcome(ticker, error=failure, attempts=attempt)
+
+            await sleep(retry.delay(attempt, failure))
+            attempt += 1
+
+    for future in asyncio.as_completed([fetch(ticker) for ticker in tickers]):
+        yield await future
@@ -0,0 +1,187 @@
+"""
+Persistent response cache.
+
+Responses are stored in SQLite, which serializes writers across processes,
+keyed on the request parameters without the API key. Entries expire when the
+"Last Refreshed" time in the Meta Data implies newer data can be published.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from json import JSONDecodeError
+
+from alphavantage.dates import (
+    MARKET_CLOSE, MARKET_OPEN, convert_to_utc, next_session_time,
+    parse_datetime, parse_date
+)
+from alphavantage.streaming import ResponseStream
+
+EPOCH = datetime(1970, 1, 1)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    retrieved_at INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+def cache_key(parameters: dict) -> str:
+    """Hash of normalized request parameters excluding the API key."""
+
+    items = sorted(
+        (key, str(value).upper() if key == 'symbol' else str(value))
+        for key, value in parameters.items() if key != 'apikey'
+    )
+
+    return hashlib.sha1(json.dumps(items).encode()).hexdigest()
+
+
+def parse_refresh_time(d: str) -> datetime:
+    """Parse "Last Refreshed" as a datetime, dates mark a completed session."""
+
+    try:
+        return parse_datetime(d)
+    except ValueError:
+        return datetime.combine(parse_date(d[0:10]), MARKET_CLOSE)
+
+
+def read_meta_data(body: bytes):
+    """Meta Data leading a response body, None for error payloads."""
+
+    try:
+        key, value = next(iter(ResponseStream([body])), (None, None))
+    except JSONDecodeError:
+        return None
+
+    return value if key == 'Meta Data' else None
+
+
+def get_expiry(meta: dict, parameters: dict) -> datetime:
+    """UTC time after which a newer response can be published."""
+
+    refreshed = next(
+        value for key, value in meta.items() if key.endswith('Last Refreshed')
+    )
+    timezone = next(
+        value for key, value in meta.items() if key.endswith('Time Zone')
+    )
+    updated_at = parse_refresh_time(refreshed)
+
+    if 'interval' in parameters:
+        interval = timedelta(minutes=int(parameters['interval'][:-3]))
+
+        if updated_at.time() < MARKET_CLOSE:
+            expires_at = updated_at + interval
+        else:
+            expires_at = next_session_time(updated_at, MARKET_OPEN) + interval
+    else:
+        expires_at = next_session_time(updated_at, MARKET_CLOSE)
+
+    return convert_to_utc(expires_at, timezone)
+
+
+def to_timestamp(dt: datetime) -> int:
+    """Naive UTC datetime as integer microseconds since the epoch."""
+
+    return (dt - EPOCH) // timedelta(microseconds=1)
+
+
+def from_timestamp(timestamp: int) -> datetime:
+    return EPOCH + timedelta(microseconds=timestamp)
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of API responses on disk."""
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, clock=time.time):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.clock = clock
+
+        with self.connect() as connection:
+            connection.execute(SCHEMA)
+
+    @contextmanager
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    def get(self, parameters: dict):
+        """Return the unexpired (body, retrieved_at) or None."""
+
+        key = cache_key(parameters)
+        now = self.clock()
+
+        with self.connect() as connection:
+            row = connection.execute(
+                'SELECT body, retrieved_at FROM responses '
+                'WHERE key = ? AND expires_at > ?', (key, now)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            connection.execute(
+                'UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key)
+            )
+
+        body, retrieved_at = row
+
+        return body, from_timestamp(retrieved_at)
+
+    def set(self, parameters: dict, body: bytes, retrieved_at: datetime):
+        """Store a time-series response body, ignoring error payloads."""
+
+        meta = read_meta_data(body)
+
+        if meta is None:
+            return
+
+        expires_at = get_expiry(meta, parameters).timestamp()
+        now = self.clock()
+
+        with self.connect() as connection:
+            connection.execute('BEGIN IMMEDIATE')
+            connection.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                (cache_key(parameters), body, len(body),
+                 to_timestamp(retrieved_at), expires_at, now)
+            )
+            self.evict(connection, now)
+            connection.execute('COMMIT')
+
+    def evict(self, connection, now):
+        """Delete expired and least recently used responses beyond the size limit."""
+
+        connection.execute('DELETE FROM responses WHERE expires_at <= ?', (now,))
+        rows = connection.execute(
+            'SELECT key, size FROM responses ORDER BY accessed_at DESC'
+        )
+        total = 0
+        evicted = []
+
+        for key, size in rows:
+            total += size
+
+            if total > self.max_bytes:
+                evicted.append((key,))
+
+        connection.executemany('DELETE FROM responses WHERE key = ?', evicted)
+
+    def clear(self):
+        with self.connect() as connection:
+            connection.execute('DELETE FROM responses')
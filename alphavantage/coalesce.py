@@ -0,0 +1,66 @@
+"""
+Coalescing of concurrent duplicate requests.
+
+Callers asking for the same key while a call is in flight wait for that
+call and receive its result or error instead of making their own.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Share one in-flight call between concurrent callers of a key.
+
+    Threads and coroutines are coalesced separately, coroutines per event
+    loop.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.tasks = {}
+
+    def call(self, key, function, *args):
+        """Return function(*args), shared with concurrent calls of key."""
+
+        with self.lock:
+            future = self.calls.get(key)
+            leader = future is None
+
+            if leader:
+                future = self.calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function(*args)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self.lock:
+                del self.calls[key]
+
+        return result
+
+    async def call_async(self, key, function, *args):
+        """Await function(*args), shared with concurrent awaits of key."""
+
+        task_key = (asyncio.get_event_loop(), key)
+        task = self.tasks.get(task_key)
+
+        if task is None:
+            task = self.tasks[task_key] = asyncio.ensure_future(function(*args))
+            task.add_done_callback(lambda _: self.tasks.pop(task_key, None))
+
+        # a cancelled caller leaves the shared call running for the others
+        return await asyncio.shield(task)
+
+
+# shared by histories created with single_flight=SINGLE_FLIGHT
+SINGLE_FLIGHT = SingleFlight()
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 from functools import lru_cache
 
 import pytz
@@ -7,6 +7,24 @@ import pytz
 DATE_FORMAT = '%Y-%m-%d'
 DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# Regular session in exchange local time
+MARKET_OPEN = time(9, 30)
+MARKET_CLOSE = time(16, 0)
+
+ONE_DAY = timedelta(days=1)
+
+
+try:
+    from_iso_date = date.fromisoformat
+    from_iso_datetime = datetime.fromisoformat
+except AttributeError:  # pragma: no cover, Python 3.6
+    def from_iso_date(d):
+        return date(int(d[0:4]), int(d[5:7]), int(d[8:10]))
+
+    def from_iso_datetime(d):
+        return datetime(int(d[0:4]), int(d[5:7]), int(d[8:10]),
+                        int(d[11:13]), int(d[14:16]), int(d[17:19]))
+
 
 @lru_cache(8192)
 def convert_to_utc(dt: datetime, timezone: str) -> datetime:
@@ -17,9 +35,72 @@ def convert_to_utc(dt: datetime, timezone: str) -> datetime:
     return zone.localize(dt).astimezone(pytz.UTC)
 
 
+def utc_converter(timezone: str):
+    """Create a converter of naive datetimes in a timezone to UTC.
+
+    The UTC offset is looked up once per day. Only days containing a DST
+    transition are localized per datetime.
+    """
+
+    zone = pytz.timezone(timezone)
+    offsets = {}
+
+    def get_offset(day):
+        start = datetime.combine(day, time())
+        offset = zone.localize(start).utcoffset()
+
+        if offset != zone.localize(start + ONE_DAY).utcoffset():
+            offset = None
+
+        offsets[day] = offset
+
+        return offset
+
+    def convert(dt: datetime) -> datetime:
+        day = dt.date()
+        offset = offsets[day] if day in offsets else get_offset(day)
+
+        if offset is None:
+            return convert_to_utc(dt, timezone)
+
+        return (dt - offset).replace(tzinfo=pytz.UTC)
+
+    return convert
+
+
 def parse_datetime(d, formatter=DATETIME_FORMAT):
+    if formatter == DATETIME_FORMAT:
+        return parse_iso_datetime(d)
+
     return datetime.strptime(d, formatter)
 
 
 def parse_date(d):
-    return parse_datetime(d, formatter=DATE_FORMAT).date()
+    """Parse the YYYY-MM-DD layout."""
+
+    if len(d) != 10 or d[4] != '-' or d[7] != '-':
+        raise ValueError(f'time data {d!r} does not match format {DATE_FORMAT!r}')
+
+    return from_iso_date(d)
+
+
+def parse_iso_datetime(d):
+    """Parse the YYYY-MM-DD HH:MM:SS layout."""
+
+    if len(d) != 19 or d[4] != '-' or d[10] != ' ' or d[13] != ':':
+        raise ValueError(
+            f'time data {d!r} does not match format {DATETIME_FORMAT!r}'
+        )
+
+    return from_iso_datetime(d)
+
+
+def next_session_time(dt: datetime, at: time) -> datetime:
+    """Next weekday datetime at the session time strictly after dt."""
+
+    session_time = datetime.combine(dt.date(), at)
+
+    while session_time <= dt or session_time.weekday() > 4:
+        session_time += ONE_DAY
+
+    return session_time
@@ -0,0 +1,39 @@
+"""
+JSON decoding of response bodies.
+
+Bodies are decoded straight from bytes, with orjson when it is installed and
+the standard library json module otherwise. Both raise JSONDecodeError.
+"""
+
+import json
+
+
+def get_default_decode():
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover
+        return json.loads
+
+    return orjson.loads
+
+
+class Decoder:
+    """Decode function shared by all requests."""
+
+    def __init__(self, decode=None):
+        self.configure(decode)
+
+    def configure(self, decode=None):
+        self.decode = get_default_decode() if decode is None else decode
+
+    def __call__(self, body):
+        return self.decode(body)
+
+
+DECODER = Decoder()
+
+
+def configure_decoder(decode=None):
+    """Set the function decoding JSON bodies, the fastest installed if None."""
+
+    DECODER.configure(decode)
@@ -0,0 +1,24 @@
+class AlphaVantageError(Exception):
+    """Error payload returned by the API."""
+
+
+class ThrottledError(AlphaVantageError):
+    """Call rejected for exceeding the API call limit."""
+
+
+class InvalidRequestError(AlphaVantageError):
+    """Call rejected as invalid, e.g. for an unknown symbol."""
+
+
+def check_response(response: dict):
+    """Raise for error payloads returned in place of data."""
+
+    if 'Meta Data' in response:
+        return
+
+    if 'Error Message' in response:
+        raise InvalidRequestError(response['Error Message'])
+
+    for key in ('Note', 'Information'):
+        if key in response:
+            raise ThrottledError(response[key])
@@ -0,0 +1,48 @@
+"""
+Instrumentation of request and parsing stages.
+
+Metrics are emitted per ticker to callbacks with the signature
+``callback(metric, value, ticker)``, for example to forward them to a
+metrics system.
+"""
+
+import time
+from contextlib import contextmanager
+
+# stage timings in seconds
+REQUEST = 'request'
+DECODE = 'decode'
+TRANSFORM = 'transform'
+TIMEZONE = 'timezone'
+SORT = 'sort'
+RATE_LIMIT_WAIT = 'rate_limit_wait'
+
+# counts
+PAYLOAD_BYTES = 'payload_bytes'
+RECORDS = 'records'
+CACHE_HIT = 'cache_hit'
+
+
+class Instrumentation:
+    """Emit metrics to callbacks."""
+
+    def __init__(self, *callbacks):
+        self.callbacks = callbacks
+
+    def emit(self, metric, value, ticker=None):
+        for callback in self.callbacks:
+            callback(metric, value, ticker)
+
+    @contextmanager
+    def timed(self, metric, ticker=None):
+        """Emit the seconds spent in the block."""
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.emit(metric, time.perf_counter() - start, ticker)
+
+
+NULL_INSTRUMENTATION = Instrumentation()
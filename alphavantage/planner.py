@@ -0,0 +1,265 @@
+"""
+Refresh planning for large universes.
+
+Tickers are only fetched when their results miss a completed session of
+their exchange, using a calendar of weekends, holidays and early closes per
+Factset exchange code.
+"""
+
+from datetime import datetime, time
+
+import pytz
+from foil.formatters import format_repr_info
+
+from alphavantage.dates import MARKET_CLOSE, ONE_DAY, convert_to_utc
+from alphavantage.price_history import COMPACT, FULL
+
+# bars in a compact response
+COMPACT_SIZE = 100
+
+# Saturday and Sunday
+WEEKEND = (5, 6)
+
+
+class ExchangeCalendar:
+    """Trading sessions of an exchange in its local time."""
+
+    def __init__(self, timezone, close_time=MARKET_CLOSE, holidays=(),
+                 early_closes=None, weekend=WEEKEND):
+        self.timezone = timezone
+        self.zone = pytz.timezone(timezone)
+        self.close_time = close_time
+        self.holidays = frozenset(holidays)
+        self.early_closes = dict(early_closes or {})
+        self.weekend = frozenset(weekend)
+
+    def is_session(self, day):
+        return day.weekday() not in self.weekend and day not in self.holidays
+
+    def close(self, day) -> datetime:
+        """Local close of the session on day."""
+
+        return datetime.combine(day, self.early_closes.get(day, self.close_time))
+
+    def previous_session(self, day):
+        day -= ONE_DAY
+
+        while not self.is_session(day):
+            day -= ONE_DAY
+
+        return day
+
+    def last_session(self, now: datetime):
+        """Day of the last session closed at the aware datetime now."""
+
+        local = now.astimezone(self.zone).replace(tzinfo=None)
+        day = local.date()
+
+        if not self.is_session(day) or local < self.close(day):
+            day = self.previous_session(day)
+
+        return day
+
+    def count_sessions(self, start, end, limit):
+        """Sessions after start through end, counting up to limit."""
+
+        count = 0
+
+        while end > start and count < limit:
+            if self.is_session(end):
+                count += 1
+
+            end -= ONE_DAY
+
+        return count
+
+
+US_CALENDAR = ExchangeCalendar('US/Eastern')
+
+# (time zone, latest regular close) by Factset exchange code, closes
+# including closing auctions so a session is only counted once it is over
+EXCHANGE_HOURS = {
+    'AMS': ('Europe/Amsterdam', time(17, 35)),
+    'ASX': ('Australia/Sydney', time(16, 10)),
+    'ATH': ('Europe/Athens', time(17, 20)),
+    'BAR': ('Europe/Madrid', time(17, 35)),
+    'BER': ('Europe/Berlin', time(22, 0)),
+    'BKK': ('Asia/Bangkok', time(16, 40)),
+    'BOM': ('Asia/Kolkata', time(16, 0)),
+    'BRU': ('Europe/Brussels', time(17, 35)),
+    'BSP': ('America/Sao_Paulo', time(18, 0)),
+    'BUE': ('America/Argentina/Buenos_Aires', time(17, 0)),
+    'CAI': ('Africa/Cairo', time(14, 30)),
+    'CAR': ('America/Caracas', time(13, 0)),
+    'CSE': ('Europe/Copenhagen', time(17, 0)),
+    'DSMD': ('Asia/Qatar', time(13, 15)),
+    'DUB': ('Europe/Dublin', time(16, 35)),
+    'DUS': ('Europe/Berlin', time(22, 0)),
+    'ETR': ('Europe/Berlin', time(17, 35)),
+    'FRA': ('Europe/Berlin', time(22, 0)),
+    'HAM': ('Europe/Berlin', time(22, 0)),
+    'HEL': ('Europe/Helsinki', time(18, 30)),
+    'HKG': ('Asia/Hong_Kong', time(16, 10)),
+    'ICE': ('Atlantic/Reykjavik', time(15, 35)),
+    'IST': ('Europe/Istanbul', time(18, 10)),
+    'JKT': ('Asia/Jakarta', time(16, 15)),
+    'JSE': ('Africa/Johannesburg', time(17, 10)),
+    'KLS': ('Asia/Kuala_Lumpur', time(17, 0)),
+    'KRX': ('Asia/Seoul', time(15, 30)),
+    'LIS': ('Europe/Lisbon', time(16, 35)),
+    'LIT': ('Europe/Vilnius', time(16, 0)),
+    'LON': ('Europe/London', time(16, 35)),
+    'MAD': ('Europe/Madrid', time(17, 35)),
+    'MEX': ('America/Mexico_City', time(15, 0)),
+    'MIC': ('Europe/Moscow', time(18, 50)),
+    'MIL': ('Europe/Rome', time(17, 35)),
+    'MUN': ('Europe/Berlin', time(22, 0)),
+    'NAS': ('US/Eastern', MARKET_CLOSE),
+    'NSE': ('Asia/Kolkata', time(16, 0)),
+    'NYS': ('US/Eastern', MARKET_CLOSE),
+    'NZE': ('Pacific/Auckland', time(17, 0)),
+    'OME': ('Europe/Stockholm', time(17, 30)),
+    'OSL': ('Europe/Oslo', time(16, 25)),
+    'OTC': ('US/Eastern', MARKET_CLOSE),
+    'PAR': ('Europe/Paris', time(17, 35)),
+    'PRA': ('Europe/Prague', time(16, 25)),
+    'RIS': ('Europe/Riga', time(16, 0)),
+    'SAU': ('Asia/Riyadh', time(15, 20)),
+    'SES': ('Asia/Singapore', time(17, 15)),
+    'SGO': ('America/Santiago', time(17, 0)),
+    'SHE': ('Asia/Shanghai', time(15, 0)),
+    'SHG': ('Asia/Shanghai', time(15, 0)),
+    'STU': ('Europe/Berlin', time(22, 0)),
+    'SWX': ('Europe/Zurich', time(17, 35)),
+    'TAE': ('Asia/Jerusalem', time(17, 30)),
+    'TAI': ('Asia/Taipei', time(14, 30)),
+    'TAL': ('Europe/Tallinn', time(16, 0)),
+    'TKS': ('Asia/Tokyo', time(15, 30)),
+    'TSE': ('America/Toronto', time(16, 0)),
+    'TSX': ('America/Toronto', time(16, 0)),
+    'WBO': ('Europe/Vienna', time(17, 35)),
+}
+
+# Sunday to Thursday trading weeks
+FRIDAY_SATURDAY = (4, 5)
+
+EXCHANGE_WEEKENDS = {
+    'CAI': FRIDAY_SATURDAY,
+    'DSMD': FRIDAY_SATURDAY,
+    'SAU': FRIDAY_SATURDAY,
+}
+
+
+def build_calendars(exchange_hours, exchange_weekends):
+    """Calendars by exchange code, shared between codes with the same hours."""
+
+    shared = {
+        (US_CALENDAR.timezone, US_CALENDAR.close_time, WEEKEND): US_CALENDAR
+    }
+    calendars = {}
+
+    for exchange_code, (timezone, close_time) in exchange_hours.items():
+        weekend = exchange_weekends.get(exchange_code, WEEKEND)
+        hours = (timezone, close_time, weekend)
+
+        if hours not in shared:
+            shared[hours] = ExchangeCalendar(timezone, close_time,
+                                             weekend=weekend)
+
+        calendars[exchange_code] = shared[hours]
+
+    return calendars
+
+
+# calendars by Factset exchange code, without holidays unless configured
+DEFAULT_CALENDARS = build_calendars(EXCHANGE_HOURS, EXCHANGE_WEEKENDS)
+
+
+class PlannedFetch:
+    """Request needed to bring a ticker's results up to date."""
+
+    def __init__(self, ticker, exchange_code, missed_sessions, output_size):
+        self.ticker = ticker
+        self.exchange_code = exchange_code
+        self.missed_sessions = missed_sessions
+        self.output_size = output_size
+
+    def __repr__(self):
+        return format_repr_info(
+            self, ['ticker', 'exchange_code', 'missed_sessions', 'output_size']
+        )
+
+
+def updated_day(results, calendar: ExchangeCalendar):
+    """Local day of the last session the results completed, None if never fetched."""
+
+    if results is None or results.updated_at is None:
+        return None
+
+    updated_at = results.updated_at
+
+    if isinstance(updated_at, datetime):
+        if updated_at.tzinfo is None:
+            updated_at = convert_to_utc(updated_at, results.timezone)
+
+        local = updated_at.astimezone(calendar.zone).replace(tzinfo=None)
+        day = local.date()
+    elif results.retrieved_at is None:
+        return updated_at
+    else:
+        # daily results are dated by a session, which may still have been
+        # open when they were retrieved, at a naive UTC time
+        retrieved_at = results.retrieved_at
+
+        if retrieved_at.tzinfo is None:
+            retrieved_at = convert_to_utc(retrieved_at, 'UTC')
+
+        local = retrieved_at.astimezone(calendar.zone).replace(tzinfo=None)
+        day = updated_at
+
+    # results updated before the close miss that session
+    if local < calendar.close(day):
+        day -= ONE_DAY
+
+    return day
+
+
+def plan_refreshes(universe, calendars=DEFAULT_CALENDARS, now=None):
+    """Fetches needed for (ticker, exchange code, results or None) entries.
+
+    Fetches are ordered by missed sessions, most first. Tickers which missed
+    more sessions than a compact response holds, or were never fetched, get
+    a full output size. Raises ValueError for exchanges without a calendar.
+    """
+
+    now = datetime.now(pytz.UTC) if now is None else now
+    last_sessions = {}
+    fetches = []
+
+    for ticker, exchange_code, results in universe:
+        calendar = calendars.get(exchange_code)
+
+        if calendar is None:
+            raise ValueError(
+                f'no calendar for exchange {exchange_code!r} of {ticker}'
+            )
+
+        if calendar not in last_sessions:
+            last_sessions[calendar] = calendar.last_session(now)
+
+        last_session = last_sessions[calendar]
+        day = updated_day(results, calendar)
+
+        if day is None:
+            missed = COMPACT_SIZE + 1
+        else:
+            missed = calendar.count_sessions(day, last_session, COMPACT_SIZE + 1)
+
+        if missed:
+            output_size = FULL if missed > COMPACT_SIZE else COMPACT
+            fetches.append(PlannedFetch(ticker, exchange_code, missed,
+                                        output_size))
+
+    fetches.sort(key=lambda fetch: (-fetch.missed_sessions, fetch.ticker))
+
+    return fetches
@@ -6,28 +6,49 @@ API Documentation
 https://www.alphavantage.co/documentation/
 """
 
+import csv
+import json
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from operator import itemgetter
-from json import JSONDecodeError
-from urllib.error import HTTPError
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, partial
+from itertools import chain, islice
+from operator import ge, itemgetter, le
 
-import requests
 from foil.formatters import format_repr_info
 from foil.records import rename_keys
 
-from alphavantage.dates import parse_date, parse_datetime, convert_to_utc
+from alphavantage.dates import (
+    MARKET_CLOSE, parse_date, parse_datetime, convert_to_utc, utc_converter
+)
 from alphavantage.reference import (
     INTRADAY, DAILY, WEEKLY, MONTHLY, OPEN, HIGH, LOW, CLOSE,
-    VOLUME, ADJUSTED_CLOSE, DIVIDEND, SPLIT_COEFFICIENT
+    VOLUME, ADJUSTED_CLOSE, DIVIDEND, SPLIT_COEFFICIENT, DATE, DATETIME
 )
 from alphavantage import web
+from alphavantage.cache import cache_key
+from alphavantage.decoding import DECODER
+from alphavantage.exceptions import ThrottledError, check_response
+from alphavantage.rate_limit import RATE_LIMITER
+from alphavantage.instrumentation import (
+    DECODE, NULL_INSTRUMENTATION, RECORDS, SORT, TIMEZONE, TRANSFORM
+)
+from alphavantage.results import ColumnarResults, LazyResults, Results
+from alphavantage.retry import RetryPolicy, run_with_retries
+from alphavantage.streaming import CHUNK_SIZE, ResponseStream
 
 
 # output size options
 COMPACT = 'compact'
 FULL = 'full'
 
+# data type options
+JSON = 'json'
+CSV = 'csv'
+
+# time zone of CSV responses, which have no Meta Data
+CSV_TIMEZONE = 'US/Eastern'
+
 # Period Options
 PERIODS = {
     INTRADAY: 'INTRADAY',
@@ -36,12 +57,14 @@ PERIODS = {
     MONTHLY: 'MONTHLY',
 }
 
-# Timestamp fields
-DATE = 'as_of_date'
-DATETIME = 'as_of_time'
-
 API_KEY = os.environ.get('ALPHA_VANTAGE_API_KEY', '')
 
+# history parameters kept out of parser processes
+PARENT_PARAMETERS = (
+    'cache', 'columnar', 'instrumentation', 'key_pool', 'lazy', 'session',
+    'single_flight'
+)
+
 
 def format_interval(interval):
     """Format intraday interval."""
@@ -63,7 +86,7 @@ ADJUSTED_RESPONSE_KEY_MAP = {
 
 INTRADAY_RESPONSE_KEY_MAP = {
     i: 'Time Series ({})'.format(format_interval(i))
-    for i in [1, 5, ]
+    for i in [1, 5, 15, 30, 60]
 }
 
 FIELD_PARSERS = {
@@ -78,23 +101,6 @@ FIELD_PARSERS = {
 }
 
 
-class Results:
-    """Container for price history results."""
-
-    def __init__(self, ticker, records, timezone, updated_at, retrieved_at):
-        self.ticker = ticker
-        self.records = records
-        self.timezone = timezone
-        self.updated_at = updated_at
-        self.retrieved_at = retrieved_at
-
-    def __eq__(self, other):
-        return self.ticker == other.ticker
-
-    def __repr__(self):
-        return format_repr_info(self, ['ticker'])
-
-
 class PriceHistory:
     """Price information summary for list of securities."""
 
@@ -104,15 +110,41 @@ class PriceHistory:
     time_field = DATE
     FIELDS = (OPEN, HIGH, LOW, CLOSE, VOLUME)
 
-    def __init__(self, period=DAILY, output_size=COMPACT, api_key=API_KEY):
+    def __init__(self, period=DAILY, output_size=COMPACT, api_key=API_KEY,
+                 cache=None, columnar=False,
+                 instrumentation=NULL_INSTRUMENTATION, session=None,
+                 datatype=JSON, lazy=False, single_flight=None, key_pool=None):
         self.period = period
         self.output_size = output_size
         self.api_key = api_key
+        self.datatype = datatype
+        self.cache = cache
+        self.columnar = columnar
+        self.lazy = lazy
+        self.single_flight = single_flight
+        self.key_pool = key_pool
+        self.instrumentation = instrumentation
         self.field_map = dict(
             zip(build_field_names(self.FIELDS), self.FIELDS)
         )
         self.sort_key = itemgetter(self.time_field)
-        self.session = requests.session()
+        self.owns_session = session is None
+        self.session = self.create_session() if session is None else session
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def create_session(self):
+        return web.create_session()
+
+    def close(self):
+        """Close the session if it was created by this instance."""
+
+        if self.owns_session and self.session is not None:
+            self.session.close()
 
     def request_parameters(self, ticker):
         ts_function = get_time_series_function(self.period, self.adjusted)
@@ -124,35 +156,339 @@ class PriceHistory:
             'outputsize': self.output_size,
         }
 
+        if self.datatype != JSON:
+            parameters['datatype'] = self.datatype
+
         return parameters
 
     def get(self, ticker):
         parameters = self.request_parameters(ticker)
-        response, retrieved_at = web.get(self.session, parameters)
+
+        if self.single_flight is None:
+            return self.request(ticker, parameters)
+
+        return self.single_flight.call(
+            self.coalesce_key(parameters), self.request, ticker, parameters
+        )
+
+    def coalesce_key(self, parameters):
+        """Key of requests which can share one fetch and parse."""
+
+        return type(self), self.columnar, self.lazy, cache_key(parameters)
+
+    def request(self, ticker, parameters):
+        parameters = dict(parameters)
+        limiter = self.get_limiter(parameters)
+
+        try:
+            if self.datatype == CSV:
+                body, retrieved_at = web.fetch(
+                    self.session, parameters, limiter=limiter,
+                    cache=self.cache, instrumentation=self.instrumentation
+                )
+
+                return self.parse_body(ticker, body, retrieved_at)
+
+            response, retrieved_at = web.get(
+                self.session, parameters, limiter=limiter, cache=self.cache,
+                instrumentation=self.instrumentation
+            )
+
+            return self.get_results(ticker, response, retrieved_at)
+        except ThrottledError as error:
+            self.report_throttle(limiter, error)
+            raise
+
+    def get_limiter(self, parameters):
+        """Limiter pacing a request, which assigns a pooled key if any."""
+
+        if self.key_pool is None:
+            return RATE_LIMITER
+
+        return self.key_pool.lease(parameters)
+
+    def report_throttle(self, limiter, error):
+        if self.key_pool is not None and limiter.key is not None:
+            self.key_pool.throttled(limiter.key, error)
+
+    def fetch(self, ticker, parameters=None, limiter=None):
+        """Request the undecoded response body and its retrieval time."""
+
+        if parameters is None:
+            parameters = self.request_parameters(ticker)
+
+        if limiter is None:
+            limiter = self.get_limiter(parameters)
+
+        return web.fetch(
+            self.session, parameters, limiter=limiter, cache=self.cache,
+            instrumentation=self.instrumentation
+        )
+
+    def sync(self, ticker, results):
+        """Merge the latest compact response into stored results.
+
+        The full history is requested instead when the compact response
+        does not overlap the stored records, or when it contains a new split
+        or dividend which changes the adjusted history.
+        """
+
+        parameters = self.request_parameters(ticker)
+        parameters['outputsize'] = COMPACT
+        latest = self.request(ticker, parameters)
+
+        if self.requires_full_history(results.records, latest.records):
+            return self.request(ticker, dict(parameters, outputsize=FULL))
+
+        return self.merge_latest(ticker, results, latest)
+
+    def merge_latest(self, ticker, results, latest):
+        """Stored results updated with the records of latest results."""
+
+        records = merge_records(results.records, latest.records, self.time_field)
+
+        return self.create_results(ticker, records, latest.timezone,
+                                   updated_at=latest.updated_at,
+                                   retrieved_at=latest.retrieved_at)
+
+    def requires_full_history(self, records, latest):
+        """Check if compact records cannot be merged into stored records."""
+
+        if not records or not latest:
+            return not records
+
+        last_time = records[-1][self.time_field]
+
+        if latest[0][self.time_field] > last_time:
+            return True
+
+        if self.adjusted:
+            new_records = [r for r in latest if r[self.time_field] > last_time]
+
+            return (any(filter_splits(new_records)) or
+                    any(filter_dividends(new_records)))
+
+        return False
+
+    def stream(self, ticker):
+        """Get results parsing the response body one record at a time."""
+
+        parameters = self.request_parameters(ticker)
+        limiter = self.get_limiter(parameters)
+        response, retrieved_at = web.stream(
+            self.session, parameters, limiter=limiter,
+            instrumentation=self.instrumentation
+        )
+
+        with response:
+            try:
+                if self.datatype == CSV:
+                    lines = response.iter_lines(CHUNK_SIZE)
+
+                    return self.get_csv_results(
+                        ticker, (line.decode() for line in lines), retrieved_at
+                    )
+
+                chunks = response.iter_content(CHUNK_SIZE)
+
+                return self.get_stream_results(ticker, chunks, retrieved_at)
+            except ThrottledError as error:
+                self.report_throttle(limiter, error)
+                raise
+
+    def get_stream_results(self, ticker, chunks, retrieved_at):
+        """Build results from response body chunks."""
+
+        response = {}
+
+        for key, value in ResponseStream(chunks, [self.data_key]):
+            if key == self.data_key:
+                if 'Meta Data' in response:
+                    return self.build_results(
+                        ticker, response['Meta Data'],
+                        self.transform_items(value), retrieved_at
+                    )
+
+                value = dict(value)
+
+            response[key] = value
 
         return self.get_results(ticker, response, retrieved_at)
 
+    def parse_body(self, ticker, body, retrieved_at):
+        """Build results from an undecoded response body."""
+
+        if self.datatype == CSV:
+            return self.get_csv_results(
+                ticker, body.decode().splitlines(), retrieved_at
+            )
+
+        with self.instrumentation.timed(DECODE, ticker):
+            response = DECODER(body)
+
+        return self.get_results(ticker, response, retrieved_at)
+
+    def get_csv_results(self, ticker, lines, retrieved_at):
+        """Build results from CSV lines, parsed one row at a time.
+
+        Errors are returned as JSON even when CSV is requested.
+        """
+
+        lines = (line for line in lines if line)
+        first = next(lines, '')
+
+        if first.startswith('{'):
+            return self.get_results(
+                ticker, json.loads(first + ''.join(lines)), retrieved_at
+            )
+
+        rows = csv.reader(chain([first], lines))
+        header = next(rows)
+        latest = next(rows, None)
+
+        if latest is None:
+            return self.create_results(ticker, [], CSV_TIMEZONE,
+                                       updated_at=None,
+                                       retrieved_at=retrieved_at)
+
+        meta = {
+            'Last Refreshed': self.csv_refresh_time(latest[0], retrieved_at),
+            'Time Zone': CSV_TIMEZONE,
+        }
+        records = self.transform_rows(header, chain([latest], rows))
+
+        return self.build_results(ticker, meta, records, retrieved_at)
+
+    def csv_refresh_time(self, last_time, retrieved_at):
+        """Last refreshed time implied by the latest row time.
+
+        The latest bar of a series retrieved before the close of its session
+        is partial, which Meta Data shows with an intraday refresh time.
+        """
+
+        if retrieved_at is None:
+            return last_time
+
+        close = convert_to_utc(
+            datetime.combine(parse_date(last_time), MARKET_CLOSE), CSV_TIMEZONE
+        )
+
+        if retrieved_at < close.replace(tzinfo=None):
+            return f'{last_time} {retrieved_at:%H:%M:%S}'
+
+        return last_time
+
+    def transform_rows(self, header, rows):
+        """Transform CSV rows, with fields in the order of the JSON path."""
+
+        columns = [
+            (field, header.index(field), FIELD_PARSERS[field])
+            for field in self.FIELDS
+        ]
+
+        for row in rows:
+            data = {field: parse(row[index]) for field, index, parse in columns}
+            data[self.time_field] = self.parse_time(row[0])
+
+            yield data
+
     def get_results(self, ticker, response, retrieved_at):
-        updated_at, timezone, is_intraday = self.transform_meta_data(response['Meta Data'])
+        check_response(response)
+        meta = response['Meta Data']
+
+        if self.lazy:
+            return self.create_lazy_results(
+                ticker, meta, response[self.data_key], retrieved_at
+            )
+
         records = self.transform_records(response[self.data_key])
-        records = self.sort_records(self.convert_timezones(records, timezone))
+
+        return self.build_results(ticker, meta, records, retrieved_at)
+
+    def create_lazy_results(self, ticker, meta, series, retrieved_at):
+        """Results keeping the raw series until records are accessed."""
+
+        updated_at, timezone, is_intraday = self.transform_meta_data(meta)
+
+        def transform(items):
+            return self.build_records(ticker, self.transform_items(items),
+                                      timezone, is_intraday)
+
+        return LazyResults(ticker, series, transform, timezone,
+                           updated_at=updated_at, retrieved_at=retrieved_at)
+
+    def build_results(self, ticker, meta, records, retrieved_at):
+        updated_at, timezone, is_intraday = self.transform_meta_data(meta)
+        records = self.build_records(ticker, records, timezone, is_intraday)
+
+        return self.create_results(ticker, records, timezone,
+                                   updated_at=updated_at,
+                                   retrieved_at=retrieved_at)
+
+    def build_records(self, ticker, records, timezone, is_intraday):
+        """Time ascending records from transformed records."""
+
+        instrumentation = self.instrumentation
+
+        with instrumentation.timed(TRANSFORM, ticker):
+            records = list(records)
+
+        with instrumentation.timed(TIMEZONE, ticker):
+            records = list(self.convert_timezones(records, timezone))
+
+        with instrumentation.timed(SORT, ticker):
+            records = self.sort_records(records)
 
         # remove intraday record in daily series
         if is_intraday:
-            records = records[0:-1]
+            del records[-1:]
+
+        instrumentation.emit(RECORDS, len(records), ticker)
+
+        return records
+
+    def create_results(self, ticker, records, timezone, updated_at,
+                       retrieved_at):
+        if self.columnar:
+            return ColumnarResults.from_records(
+                ticker, records, self.time_field, timezone,
+                updated_at=updated_at, retrieved_at=retrieved_at
+            )
 
         return Results(ticker, records, timezone,
                        updated_at=updated_at, retrieved_at=retrieved_at)
 
     def sort_records(self, records):
-        """Sort records in ascending time order."""
+        """Sort records in ascending time order.
+
+        Lists are ordered in place. Series already in ascending or
+        descending order are ordered in linear time.
+        """
+
+        if not isinstance(records, list):
+            records = list(records)
+
+        times = list(map(self.sort_key, records))
+
+        if all(map(le, times, islice(times, 1, None))):
+            return records
 
-        return sorted(list(records), key=self.sort_key)
+        if all(map(ge, times, islice(times, 1, None))):
+            records.reverse()
+        else:
+            records.sort(key=self.sort_key)
+
+        return records
 
     def transform_records(self, records):
         """Convert record field names, parse values and add time field."""
 
-        for time_string, record in records.items():
+        return self.transform_items(records.items())
+
+    def transform_items(self, items):
+        """Transform (time string, record) pairs as they are read."""
+
+        for time_string, record in items:
             data = self.transform_record(record)
             data[self.time_field] = self.parse_time(time_string)
 
@@ -227,9 +563,9 @@ class IntradayPriceHistory(PriceHistory):
     RESPONSE_MAP = INTRADAY_RESPONSE_KEY_MAP
 
     def __init__(self, output_size=COMPACT, api_key=API_KEY, interval=1,
-                 utc=True):
+                 utc=True, **kwargs):
         super().__init__(
-            period=INTRADAY, output_size=output_size, api_key=api_key
+            period=INTRADAY, output_size=output_size, api_key=api_key, **kwargs
         )
         self.interval = interval
         self.utc = utc
@@ -247,13 +583,23 @@ class IntradayPriceHistory(PriceHistory):
     def parse_time(self, d):
         return parse_datetime(d)
 
+    def csv_refresh_time(self, last_time, retrieved_at):
+        return last_time
+
+    def coalesce_key(self, parameters):
+        return super().coalesce_key(parameters) + (self.utc,)
+
     def convert_timezones(self, records, timezone):
-        if self.utc:
-            for record in records:
-                dt = convert_to_utc(record[self.time_field], timezone)
-                record[self.time_field] = dt
+        if not self.utc:
+            yield from records
+            return
+
+        convert = utc_converter(timezone)
+
+        for record in records:
+            record[self.time_field] = convert(record[self.time_field])
 
-                yield record
+            yield record
 
     def transform_meta_data(self, response_meta):
         updated_at, timezone, _ = super().transform_meta_data(response_meta)
@@ -302,19 +648,156 @@ def filter_dividends(records):
             yield record[DATE], record[DIVIDEND]
 
 
-def get_results(cls: PriceHistory, tickers: list, parameters: dict):
-    """Return multiple results using threads."""
+def get_method(history: PriceHistory, stream=False):
+    return history.stream if stream else history.get
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        future_to_ticker = {
-            executor.submit(cls(**parameters).get, ticker): ticker
-            for ticker in tickers
-        }
 
-        for future in as_completed(future_to_ticker):
-            ticker = future_to_ticker[future]
+def merge_records(records, latest, time_field):
+    """Replace stored records from the start of the latest records onward."""
+
+    if not latest:
+        return list(records)
+
+    start = latest[0][time_field]
+    index = len(records)
+
+    while index and records[index - 1][time_field] >= start:
+        index -= 1
+
+    return list(records[0:index]) + list(latest)
+
+
+class FanOut:
+    """Threads, connections, retries and parser processes of a multi-ticker run.
+
+    The session is sized to max_workers connections unless pool_size is
+    given. When processes is set, threads only fetch response bodies, which
+    are decoded and transformed by that many worker processes.
+    """
+
+    def __init__(self, max_workers=4, pool_size=None, keep_alive=True,
+                 retry: RetryPolicy = None, processes=None):
+        self.max_workers = max_workers
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        self.retry = RetryPolicy() if retry is None else retry
+        self.processes = processes
+
+    def __repr__(self):
+        return format_repr_info(
+            self, ['max_workers', 'pool_size', 'keep_alive', 'processes']
+        )
+
+    def create_session(self):
+        return web.create_session(self.pool_size or self.max_workers,
+                                  self.keep_alive)
+
+
+DEFAULT_FAN_OUT = FanOut()
+
+
+def get_results(cls: PriceHistory, tickers: list, parameters: dict,
+                stream=False, fan_out: FanOut = DEFAULT_FAN_OUT):
+    """Return multiple results using threads sharing a connection pool.
+
+    Responses are parsed one record at a time when stream is set. Tickers
+    failing after retries are skipped, see get_outcomes.
+    """
+
+    outcomes = get_outcomes(cls, tickers, parameters, stream, fan_out)
+
+    for outcome in outcomes:
+        if outcome.ok:
+            yield outcome.ticker, outcome.results
+
+
+def get_outcomes(cls: PriceHistory, tickers: list, parameters: dict,
+                 stream=False, fan_out: FanOut = DEFAULT_FAN_OUT):
+    """Return an Outcome with results or the final error for each ticker.
+
+    With fan_out.processes, responses are parsed in worker processes into
+    ColumnarResults.
+    """
+
+    if fan_out.processes:
+        if stream:
+            raise ValueError('stream cannot be combined with processes')
+
+        yield from get_parsed_outcomes(cls, tickers, parameters, fan_out)
+        return
+
+    def get(history, ticker):
+        return get_method(history, stream)(ticker)
+
+    yield from map_tickers(get, cls, tickers, parameters, fan_out)
+
+
+def get_parsed_outcomes(cls: PriceHistory, tickers: list, parameters: dict,
+                        fan_out: FanOut = DEFAULT_FAN_OUT):
+    """Fetch on threads and parse on a process pool."""
+
+    parser_parameters = tuple(sorted(
+        (key, value) for key, value in parameters.items()
+        if key not in PARENT_PARAMETERS
+    ))
+
+    with ProcessPoolExecutor(max_workers=fan_out.processes) as parsers:
+        def get(history, ticker):
+            parameters = history.request_parameters(ticker)
+            limiter = history.get_limiter(parameters)
+            body, retrieved_at = history.fetch(ticker, parameters, limiter)
+            parsed = parsers.submit(parse_body, cls, parser_parameters,
+                                    ticker, body, retrieved_at)
 
             try:
-                yield ticker, future.result()
-            except (HTTPError, JSONDecodeError, KeyError):
-                pass
+                return parsed.result()
+            except ThrottledError as error:
+                history.report_throttle(limiter, error)
+                raise
+
+        yield from map_tickers(get, cls, tickers, parameters, fan_out)
+
+
+@lru_cache(maxsize=None)
+def get_parser(cls: PriceHistory, parameters: tuple):
+    """History used to parse responses within a worker process."""
+
+    return cls(columnar=True, **dict(parameters))
+
+
+def parse_body(cls: PriceHistory, parameters: tuple, ticker, body,
+               retrieved_at):
+    """Decode and transform a response body in a worker process."""
+
+    return get_parser(cls, parameters).parse_body(ticker, body, retrieved_at)
+
+
+def sync_results(cls: PriceHistory, stored: dict, parameters: dict,
+                 fan_out: FanOut = DEFAULT_FAN_OUT):
+    """Sync multiple stored results by ticker using threads."""
+
+    def sync(history, ticker):
+        return history.sync(ticker, stored[ticker])
+
+    outcomes = map_tickers(sync, cls, stored, parameters, fan_out)
+
+    for outcome in outcomes:
+        if outcome.ok:
+            yield outcome.ticker, outcome.results
+
+
+def map_tickers(function, cls: PriceHistory, tickers, parameters: dict,
+                fan_out: FanOut = DEFAULT_FAN_OUT):
+    """Yield an Outcome of function(history, ticker) for each ticker.
+
+    The threads share one history and its session, which is closed when
+    done. Throttled and transient failures are retried with backoff.
+    """
+
+    session = fan_out.create_session()
+    history = cls(session=session, **parameters)
+
+    with session, ThreadPoolExecutor(fan_out.max_workers) as executor:
+        yield from run_with_retries(
+            executor, partial(function, history), tickers, fan_out.retry
+        )
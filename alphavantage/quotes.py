@@ -0,0 +1,165 @@
+"""
+Latest quotes for many tickers per request.
+
+The batch quotes endpoint returns the latest price and volume of up to
+BATCH_SIZE symbols per call, so a watchlist costs one call per batch instead
+of one call per ticker.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from alphavantage import web
+from alphavantage.dates import convert_to_utc, parse_datetime
+from alphavantage.exceptions import InvalidRequestError, check_response
+from alphavantage.instrumentation import NULL_INSTRUMENTATION, RECORDS
+from alphavantage.price_history import API_KEY, DATETIME, DEFAULT_FAN_OUT, FanOut
+from alphavantage.reference import VOLUME
+from alphavantage.results import Results
+from alphavantage.retry import Outcome, run_with_retries
+
+BATCH_SIZE = 100
+
+PRICE = 'price'
+
+# quote fields by response key suffix
+QUOTE_FIELDS = {
+    'symbol': 'symbol',
+    'price': PRICE,
+    'volume': VOLUME,
+    'timestamp': DATETIME,
+}
+
+
+def parse_volume(value):
+    """Parse volume, None when not reported."""
+
+    return int(value) if value.isdigit() else None
+
+
+class BatchQuotes:
+    """Latest quotes for batches of tickers."""
+
+    def __init__(self, api_key=API_KEY, utc=True,
+                 instrumentation=NULL_INSTRUMENTATION, session=None):
+        self.api_key = api_key
+        self.utc = utc
+        self.instrumentation = instrumentation
+        self.owns_session = session is None
+        self.session = web.create_session() if session is None else session
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the session if it was created by this instance."""
+
+        if self.owns_session:
+            self.session.close()
+
+    def request_parameters(self, tickers):
+        return {
+            'function': 'BATCH_STOCK_QUOTES',
+            'symbols': ','.join(tickers),
+            'apikey': self.api_key,
+        }
+
+    def get(self, tickers):
+        """Return results by ticker for one batch of tickers.
+
+        Unknown tickers are left out of the response.
+        """
+
+        response, retrieved_at = web.get(
+            self.session, self.request_parameters(tickers),
+            instrumentation=self.instrumentation
+        )
+
+        return self.get_results(response, retrieved_at)
+
+    def get_results(self, response, retrieved_at):
+        check_response(response)
+        meta = response['Meta Data']
+        timezone = next(
+            value for key, value in meta.items() if key.endswith('Time Zone')
+        )
+        results = {}
+
+        for quote in response['Stock Quotes']:
+            record = self.transform_quote(quote, timezone)
+            ticker = record.pop('symbol')
+            results[ticker] = Results(
+                ticker, [record], timezone, updated_at=record[DATETIME],
+                retrieved_at=retrieved_at
+            )
+
+        self.instrumentation.emit(RECORDS, len(results))
+
+        return results
+
+    def transform_quote(self, quote, timezone):
+        record = {
+            QUOTE_FIELDS[key.split(' ', 1)[-1]]: value
+            for key, value in quote.items()
+        }
+        record[PRICE] = float(record[PRICE])
+        record[VOLUME] = parse_volume(record[VOLUME])
+        record[DATETIME] = parse_datetime(record[DATETIME])
+
+        if self.utc:
+            record[DATETIME] = convert_to_utc(record[DATETIME], timezone)
+
+        return record
+
+
+def split_batches(tickers, batch_size=BATCH_SIZE):
+    """Split tickers into tuples of at most batch_size tickers."""
+
+    tickers = list(tickers)
+
+    return [
+        tuple(tickers[i:i + batch_size])
+        for i in range(0, len(tickers), batch_size)
+    ]
+
+
+def get_quotes(tickers, parameters=None, batch_size=BATCH_SIZE,
+               fan_out: FanOut = DEFAULT_FAN_OUT):
+    """Return latest quote results by ticker, requesting batches in threads.
+
+    Tickers of batches failing after retries are skipped, see
+    get_quote_outcomes.
+    """
+
+    outcomes = get_quote_outcomes(tickers, parameters, batch_size, fan_out)
+
+    for outcome in outcomes:
+        if outcome.ok:
+            yield outcome.ticker, outcome.results
+
+
+def get_quote_outcomes(tickers, parameters=None, batch_size=BATCH_SIZE,
+                       fan_out: FanOut = DEFAULT_FAN_OUT):
+    """Return an Outcome per ticker with its quote or its batch's error.
+
+    Tickers left out of a successful response fail with InvalidRequestError.
+    """
+
+    session = fan_out.create_session()
+    quotes = BatchQuotes(session=session, **(parameters or {}))
+    batches = split_batches(tickers, batch_size)
+
+    with session, ThreadPoolExecutor(fan_out.max_workers) as executor:
+        outcomes = run_with_retries(executor, quotes.get, batches, fan_out.retry)
+
+        for batch in outcomes:
+            for ticker in batch.ticker:
+                results = batch.results.get(ticker.upper()) if batch.ok else None
+                error = batch.error
+
+                if batch.ok and results is None:
+                    error = InvalidRequestError(f'no quote for {ticker}')
+
+                yield Outcome(ticker, results, error, batch.attempts)
@@ -0,0 +1,208 @@
+"""
+Request pacing for Alpha Vantage call budgets.
+
+Calls beyond the key's budget return a "Note" payload instead of data, so
+requests are scheduled to stay within the per-minute and per-day limits
+rather than being allowed to fail.
+"""
+
+import os
+import time
+from collections import Counter, deque
+from threading import Lock
+
+MINUTE = 60
+DAY = 24 * 60 * 60
+
+
+def get_env_limit(name):
+    """Read an optional integer call limit from the environment."""
+
+    value = os.environ.get(name, '')
+
+    return int(value) if value else None
+
+
+class CallWindow:
+    """Rolling window allowing a fixed number of calls per period."""
+
+    def __init__(self, calls, period):
+        self.calls = calls
+        self.period = period
+        self.history = deque()
+
+    def earliest(self, now):
+        """Earliest time the next call fits in the window."""
+
+        while self.history and self.history[0] <= now - self.period:
+            self.history.popleft()
+
+        if len(self.history) < self.calls:
+            return now
+
+        return self.history[-self.calls] + self.period
+
+    def record(self, scheduled_at):
+        self.history.append(scheduled_at)
+
+    def remaining(self, now):
+        """Calls left in the window, counting reserved calls."""
+
+        self.earliest(now)
+
+        return self.calls - len(self.history)
+
+
+class RateLimiter:
+    """Thread-safe scheduler pacing calls within per-minute and per-day limits."""
+
+    def __init__(self, calls_per_minute=None, calls_per_day=None,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.clock = clock
+        self.sleep = sleep
+        self.lock = Lock()
+        self.windows = []
+        self.configure(calls_per_minute, calls_per_day)
+
+    def configure(self, calls_per_minute=None, calls_per_day=None):
+        """Set call limits, a limit of None is unlimited."""
+
+        windows = [
+            CallWindow(calls, period)
+            for calls, period in ((calls_per_minute, MINUTE), (calls_per_day, DAY))
+            if calls
+        ]
+
+        with self.lock:
+            self.windows = windows
+
+    def reserve(self, not_before=None):
+        """Reserve the next call slot and return the seconds to wait for it.
+
+        The slot is no earlier than the clock time not_before when given.
+        """
+
+        with self.lock:
+            now = self.clock()
+            scheduled_at = max(
+                [now if not_before is None else max(now, not_before)] +
+                [window.earliest(now) for window in self.windows]
+            )
+
+            for window in self.windows:
+                window.record(scheduled_at)
+
+        return scheduled_at - now
+
+    def acquire(self):
+        """Block until a call is allowed, returning the seconds waited."""
+
+        delay = self.reserve()
+
+        if delay > 0:
+            self.sleep(delay)
+
+        return delay
+
+    def budget(self):
+        """Earliest next call time and calls left in the tightest window."""
+
+        with self.lock:
+            now = self.clock()
+            earliest = max(
+                [now] + [window.earliest(now) for window in self.windows]
+            )
+            remaining = min(
+                [window.remaining(now) for window in self.windows],
+                default=float('inf')
+            )
+
+        return earliest, remaining
+
+
+# shared by every request in the process
+RATE_LIMITER = RateLimiter(
+    calls_per_minute=get_env_limit('ALPHA_VANTAGE_CALLS_PER_MINUTE'),
+    calls_per_day=get_env_limit('ALPHA_VANTAGE_CALLS_PER_DAY')
+)
+
+
+def configure_rate_limit(calls_per_minute=None, calls_per_day=None):
+    """Set the call limits shared by all requests in the process."""
+
+    RATE_LIMITER.configure(calls_per_minute, calls_per_day)
+
+
+class KeyPool:
+    """API keys each paced within their own call budget.
+
+    Each call is assigned to the key which can make it soonest, preferring
+    the key with the most calls left. Keys rejected as throttled are rested
+    for a minute, or a day when the daily limit was reached.
+    """
+
+    def __init__(self, keys, calls_per_minute=None, calls_per_day=None,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.clock = clock
+        self.sleep = sleep
+        self.lock = Lock()
+        self.limiters = {
+            key: RateLimiter(calls_per_minute, calls_per_day, clock, sleep)
+            for key in keys
+        }
+        self.resting_until = {}
+        self.usage = Counter()
+        self.throttles = Counter()
+
+    def rank(self, key):
+        earliest, remaining = self.limiters[key].budget()
+
+        return max(earliest, self.resting_until.get(key, earliest)), -remaining
+
+    def reserve(self):
+        """Assign the next call to a key, returning (key, seconds to wait)."""
+
+        with self.lock:
+            key = min(self.limiters, key=self.rank)
+            delay = self.limiters[key].reserve(self.resting_until.get(key))
+            self.usage[key] += 1
+
+        return key, delay
+
+    def lease(self, parameters: dict):
+        """Limiter for one request, which sets its key when the call is made."""
+
+        return KeyLease(self, parameters)
+
+    def throttled(self, key, error):
+        """Rest a key whose call was rejected for exceeding its limit."""
+
+        # the per minute note also quotes the daily limit
+        period = MINUTE if 'minute' in str(error).lower() else DAY
+
+        with self.lock:
+            self.throttles[key] += 1
+            self.resting_until[key] = self.clock() + period
+
+
+class KeyLease:
+    """Limiter assigning a pooled API key to request parameters."""
+
+    def __init__(self, pool: KeyPool, parameters: dict):
+        self.pool = pool
+        self.parameters = parameters
+        self.key = None
+
+    def reserve(self):
+        self.key, delay = self.pool.reserve()
+        self.parameters['apikey'] = self.key
+
+        return delay
+
+    def acquire(self):
+        delay = self.reserve()
+
+        if delay > 0:
+            self.pool.sleep(delay)
+
+        return delay
@@ -15,3 +15,7 @@ VOLUME = 'volume'
 ADJUSTED_CLOSE = 'adjusted_close'
 DIVIDEND = 'dividend_amount'
 SPLIT_COEFFICIENT = 'split_coefficient'
+
+# timestamp fields
+DATE = 'as_of_date'
+DATETIME = 'as_of_time'
@@ -0,0 +1,121 @@
+"""
+Resampling of price history into coarser bars.
+
+Daily records are aggregated into weekly or monthly bars and intraday
+records into any minute interval, in one pass over time ascending records.
+Bars are labeled like Alpha Vantage series: weekly and monthly bars by their
+last trading day, intraday bars by the end of their interval, which is
+anchored to the market open in the exchange time zone.
+"""
+
+from datetime import datetime, timedelta
+from itertools import groupby
+from math import ceil
+from operator import add, mul
+
+import pytz
+
+from alphavantage.dates import MARKET_CLOSE, MARKET_OPEN, utc_converter
+from alphavantage.price_history import DATE, DATETIME
+from alphavantage.reference import (
+    ADJUSTED_CLOSE, CLOSE, DIVIDEND, HIGH, LOW, MONTHLY, SPLIT_COEFFICIENT,
+    VOLUME, WEEKLY
+)
+from alphavantage.results import Results
+
+
+def last(_, value):
+    return value
+
+
+# combine an aggregated bar value with the next record value, the first
+# record value is kept for other fields, e.g. open
+COMBINERS = {
+    HIGH: max,
+    LOW: min,
+    CLOSE: last,
+    VOLUME: add,
+    ADJUSTED_CLOSE: last,
+    DIVIDEND: add,
+    SPLIT_COEFFICIENT: mul,
+    DATE: last,
+    DATETIME: last,
+}
+
+# group keys of dates by period
+PERIOD_KEYS = {
+    WEEKLY: lambda d: d.isocalendar()[0:2],
+    MONTHLY: lambda d: (d.year, d.month),
+}
+
+
+def aggregate(records):
+    """Aggregate time ascending records into one bar."""
+
+    records = iter(records)
+    bar = dict(next(records))
+
+    for record in records:
+        for field, value in record.items():
+            combine = COMBINERS.get(field)
+
+            if combine is not None:
+                bar[field] = combine(bar[field], value)
+
+    return bar
+
+
+def resample_period(results: Results, period) -> Results:
+    """Resample daily results into weekly or monthly bars."""
+
+    period_key = PERIOD_KEYS[period]
+    groups = groupby(results.records, lambda record: period_key(record[DATE]))
+    records = (aggregate(group) for _, group in groups)
+
+    return Results(results.ticker, list(records), results.timezone,
+                   updated_at=results.updated_at,
+                   retrieved_at=results.retrieved_at)
+
+
+def resample_interval(results: Results, interval: int) -> Results:
+    """Resample intraday results into bars of interval minutes.
+
+    Times may be naive exchange times or UTC, as from IntradayPriceHistory.
+    """
+
+    zone = pytz.timezone(results.timezone)
+    to_utc = utc_converter(results.timezone)
+    length = timedelta(minutes=interval)
+
+    def bar_end(record):
+        """Local end of the interval containing the record time."""
+
+        time = record[DATETIME]
+
+        if time.tzinfo is not None:
+            time = time.astimezone(zone).replace(tzinfo=None)
+
+        day = time.date()
+        open_time = datetime.combine(day, MARKET_OPEN)
+        close_time = datetime.combine(day, MARKET_CLOSE)
+        end = open_time + ceil((time - open_time) / length) * length
+
+        # the last interval of the session ends at the close
+        if time <= close_time < end:
+            end = close_time
+
+        return end
+
+    def label(bar, end):
+        bar[DATETIME] = end if bar[DATETIME].tzinfo is None else to_utc(end)
+
+        return bar
+
+    records = (
+        label(aggregate(group), end)
+        for end, group in groupby(results.records, bar_end)
+    )
+
+    return Results(results.ticker, list(records), results.timezone,
+                   updated_at=results.updated_at,
+                   retrieved_at=results.retrieved_at)
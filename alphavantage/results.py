@@ -0,0 +1,283 @@
+"""Containers for price history results."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+from heapq import nlargest
+from operator import itemgetter
+from threading import Lock
+
+from foil.formatters import format_repr_info
+
+from alphavantage.reference import DATE, DATETIME
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+# array typecodes by parsed field type
+TYPECODES = {
+    int: 'q',
+    float: 'd',
+}
+
+
+class Results:
+    """Container for price history results."""
+
+    def __init__(self, ticker, records, timezone, updated_at, retrieved_at):
+        self.ticker = ticker
+        self.records = records
+        self.timezone = timezone
+        self.updated_at = updated_at
+        self.retrieved_at = retrieved_at
+
+    def __eq__(self, other):
+        return self.ticker == other.ticker
+
+    def __repr__(self):
+        return format_repr_info(self, ['ticker'])
+
+    def time_index(self):
+        """Ascending record times, rebuilt when records are reassigned or grow."""
+
+        records = self.records
+        indexed, index = self.__dict__.get('index', (None, None))
+
+        if indexed is not records or len(index) != len(records):
+            field = DATETIME if records and DATETIME in records[0] else DATE
+            index = [record[field] for record in records]
+            self.index = (records, index)
+
+        return index
+
+    def encode_time(self, value):
+        return value
+
+    def bounds(self, start=None, end=None):
+        """Record index range with times from start through end."""
+
+        index = self.time_index()
+        low = 0 if start is None else bisect_left(index, self.encode_time(start))
+        high = len(index) if end is None else bisect_right(
+            index, self.encode_time(end)
+        )
+
+        return low, high
+
+    def between(self, start=None, end=None):
+        """Results with times from start through end, by binary search."""
+
+        low, high = self.bounds(start, end)
+
+        return Results(self.ticker, self.records[low:high], self.timezone,
+                       updated_at=self.updated_at,
+                       retrieved_at=self.retrieved_at)
+
+    def as_of(self, time):
+        """Last record at or before time, None when there is none."""
+
+        position = bisect_right(self.time_index(), self.encode_time(time))
+
+        return self.records[position - 1] if position else None
+
+    def nearest(self, time):
+        """Record nearest to time, the earlier one when tied."""
+
+        index = self.time_index()
+        key = self.encode_time(time)
+        position = bisect_left(index, key)
+        candidates = [i for i in (position - 1, position) if 0 <= i < len(index)]
+
+        if not candidates:
+            return None
+
+        return self.records[min(candidates, key=lambda i: abs(index[i] - key))]
+
+
+class LazyResults(Results):
+    """Price history results transforming the raw series when accessed.
+
+    The raw series maps time strings to raw records. transform converts
+    (time string, raw record) items to time ascending records, once, also
+    when records are first accessed from several threads.
+    """
+
+    def __init__(self, ticker, series, transform, timezone, updated_at,
+                 retrieved_at):
+        self.ticker = ticker
+        self.series = series
+        self.transform = transform
+        self.timezone = timezone
+        self.updated_at = updated_at
+        self.retrieved_at = retrieved_at
+        self.transformed = None
+        self.lock = Lock()
+
+    @property
+    def records(self):
+        if self.transformed is None:
+            with self.lock:
+                if self.transformed is None:
+                    self.transformed = self.transform(self.series.items())
+                    self.series = None
+
+        return self.transformed
+
+    def latest(self, count=1):
+        """The latest count records, transforming only those.
+
+        One more item is transformed in case the latest is a partial session
+        which is removed.
+        """
+
+        # records set transformed before dropping the series
+        series = self.series
+
+        if series is None:
+            return self.transformed[-count:]
+
+        items = nlargest(count + 1, series.items(), key=itemgetter(0))
+
+        return self.transform(items)[-count:]
+
+
+class ColumnarResults(Results):
+    """Price history results stored as typed arrays per field.
+
+    Times are stored as integers, date ordinals for daily series and
+    microseconds since the epoch for intraday series. Columns may also be
+    read-only memoryviews, see alphavantage.store.
+    """
+
+    def __init__(self, ticker, time_field, times, columns, timezone,
+                 updated_at, retrieved_at, is_datetime=False, tzinfo=None):
+        self.ticker = ticker
+        self.time_field = time_field
+        self.times = times
+        self.columns = columns
+        self.timezone = timezone
+        self.updated_at = updated_at
+        self.retrieved_at = retrieved_at
+        self.is_datetime = is_datetime
+        self.tzinfo = tzinfo
+
+    @classmethod
+    def from_records(cls, ticker, records, time_field, timezone, updated_at,
+                     retrieved_at):
+        """Build columns from time ascending records."""
+
+        records = iter(records)
+        first = next(records, None)
+
+        if first is None:
+            return cls(ticker, time_field, array('q'), {}, timezone,
+                       updated_at, retrieved_at)
+
+        fields = [field for field in first if field != time_field]
+        first_time = first[time_field]
+        is_datetime = isinstance(first_time, datetime)
+        columns = {
+            field: array(TYPECODES[type(first[field])]) for field in fields
+        }
+        results = cls(ticker, time_field, array('q'), columns, timezone,
+                      updated_at, retrieved_at, is_datetime=is_datetime,
+                      tzinfo=first_time.tzinfo if is_datetime else None)
+        results.append(first)
+
+        for record in records:
+            results.append(record)
+
+        return results
+
+    def append(self, record):
+        self.times.append(self.encode_time(record[self.time_field]))
+
+        for field, column in self.columns.items():
+            column.append(record[field])
+
+    def encode_time(self, value):
+        if not self.is_datetime:
+            return value.toordinal()
+
+        if value.tzinfo is not None:
+            value = value.replace(tzinfo=None) - value.utcoffset()
+
+        return (value - EPOCH) // MICROSECOND
+
+    def decode_time(self, value):
+        if not self.is_datetime:
+            return date.fromordinal(value)
+
+        return (EPOCH + value * MICROSECOND).replace(tzinfo=self.tzinfo)
+
+    def column(self, field):
+        """Typed array of field values, times are decoded."""
+
+        if field == self.time_field:
+            return [self.decode_time(value) for value in self.times]
+
+        return self.columns[field]
+
+    def time_index(self):
+        return self.times
+
+    def between(self, start=None, end=None):
+        low, high = self.bounds(start, end)
+
+        return ColumnarResults(
+            self.ticker, self.time_field, self.times[low:high],
+            {field: column[low:high] for field, column in self.columns.items()},
+            self.timezone, self.updated_at, self.retrieved_at,
+            is_datetime=self.is_datetime, tzinfo=self.tzinfo
+        )
+
+    def record(self, index):
+        record = {
+            field: column[index] for field, column in self.columns.items()
+        }
+        record[self.time_field] = self.decode_time(self.times[index])
+
+        return record
+
+    @property
+    def records(self):
+        return RecordView(self)
+
+
+class RecordView(Sequence):
+    """Read-only sequence of record dicts over columnar results."""
+
+    def __init__(self, results):
+        self.results = results
+
+    def __len__(self):
+        return len(self.results.times)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.results.record(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('record index out of range')
+
+        return self.results.record(index)
+
+    def __iter__(self):
+        results = self.results
+        fields = list(results.columns)
+
+        for time, *values in zip(results.times, *results.columns.values()):
+            record = dict(zip(fields, values))
+            record[results.time_field] = results.decode_time(time)
+
+            yield record
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+
+        return list(self) == list(other)
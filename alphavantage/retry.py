@@ -0,0 +1,129 @@
+"""
+Retry scheduling for requests over many tickers.
+
+Throttled and transient failures are requeued with jittered exponential
+backoff, permanent failures are reported in each ticker's outcome.
+"""
+
+import heapq
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from itertools import count
+from json import JSONDecodeError
+
+from foil.formatters import format_repr_info
+from requests import ConnectionError, HTTPError, RequestException, Timeout
+
+from alphavantage.exceptions import AlphaVantageError, ThrottledError
+
+# errors reported in outcomes, others propagate
+REQUEST_ERRORS = (AlphaVantageError, RequestException, JSONDecodeError, KeyError)
+
+# seconds for a per minute call window to reset
+THROTTLE_DELAY = 60.0
+
+
+def is_transient(error: Exception) -> bool:
+    """Check if a failed request may succeed when retried."""
+
+    if isinstance(error, HTTPError):
+        status = error.response.status_code if error.response is not None else 0
+
+        return status == 429 or status >= 500
+
+    return isinstance(
+        error, (ThrottledError, JSONDecodeError, ConnectionError, Timeout)
+    )
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter for transient failures.
+
+    Throttled calls also wait throttle_delay, so a retry lands after the
+    call window which rejected them has reset.
+    """
+
+    def __init__(self, max_attempts=5, base_delay=1.0, max_delay=60.0,
+                 throttle_delay=THROTTLE_DELAY, jitter=random.random):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.throttle_delay = throttle_delay
+        self.jitter = jitter
+
+    def should_retry(self, error, attempt, transient=is_transient):
+        return attempt < self.max_attempts and transient(error)
+
+    def delay(self, attempt, error=None):
+        """Seconds before the next attempt, between half and all of the backoff."""
+
+        backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay = backoff * (0.5 + self.jitter() / 2)
+
+        if isinstance(error, ThrottledError):
+            delay += self.throttle_delay
+
+        return delay
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class Outcome:
+    """Result or final error of a ticker's request."""
+
+    def __init__(self, ticker, results=None, error=None, attempts=1):
+        self.ticker = ticker
+        self.results = results
+        self.error = error
+        self.attempts = attempts
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return format_repr_info(self, ['ticker', 'error', 'attempts'])
+
+
+def run_with_retries(executor, function, tickers, policy: RetryPolicy,
+                     clock=time.monotonic, sleep=time.sleep):
+    """Yield an Outcome per ticker as function(ticker) calls complete.
+
+    Transient failures are resubmitted to the executor after a backoff.
+    """
+
+    pending = {executor.submit(function, ticker): (ticker, 1) for ticker in tickers}
+    delayed = []
+    order = count()
+
+    while pending or delayed:
+        now = clock()
+
+        while delayed and delayed[0][0] <= now:
+            _, _, ticker, attempt = heapq.heappop(delayed)
+            pending[executor.submit(function, ticker)] = (ticker, attempt)
+
+        timeout = delayed[0][0] - now if delayed else None
+
+        if not pending:
+            sleep(timeout)
+            continue
+
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            ticker, attempt = pending.pop(future)
+
+            try:
+                results = future.result()
+            except REQUEST_ERRORS as error:
+                if policy.should_retry(error, attempt):
+                    ready_at = clock() + policy.delay(attempt, error)
+                    heapq.heappush(delayed, (ready_at, next(order), ticker,
+                                             attempt + 1))
+                else:
+                    yield Outcome(ticker, error=error, attempts=attempt)
+            else:
+                yield Outcome(ticker, results, attempts=attempt)
@@ -0,0 +1,232 @@
+"""
+Local binary store of price history results.
+
+Each ticker, time series function and interval is stored in one file: a
+fixed-size JSON header followed by fixed-width rows of 8 byte values, the
+time followed by each field in native byte order. Files are only appended
+to, and are read through a memory map so loading is zero-copy and values are
+only boxed into Python objects when records are accessed.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from bisect import bisect_right
+from datetime import datetime
+
+import pytz
+
+from alphavantage.dates import from_iso_date, from_iso_datetime
+from alphavantage.results import ColumnarResults
+
+MAGIC = b'AVPH'
+VERSION = 1
+HEADER_SIZE = 1024
+VALUE_SIZE = 8
+
+
+def encode_stamp(value):
+    if value is None:
+        return None
+
+    kind = 'datetime' if isinstance(value, datetime) else 'date'
+
+    return [kind, value.isoformat()]
+
+
+def decode_stamp(value):
+    if value is None:
+        return None
+
+    kind, text = value
+
+    return from_iso_datetime(text) if kind == 'datetime' else from_iso_date(text)
+
+
+class PriceStore:
+    """Directory of memory-mapped price history files."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path(self, history, ticker):
+        parameters = history.request_parameters(ticker)
+        name = '_'.join(filter(None, (
+            parameters['function'], parameters.get('interval')
+        )))
+
+        return os.path.join(self.directory, name, f'{ticker.upper()}.bin')
+
+    def load(self, history, ticker):
+        """Map stored results, None when the ticker is not stored."""
+
+        path = self.path(history, ticker)
+
+        try:
+            file = open(path, 'rb')
+        except FileNotFoundError:
+            return None
+
+        with file:
+            header = read_header(file)
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        fields = header['fields']
+        width = len(fields) + 1
+        rows = (len(mapped) - HEADER_SIZE) // (width * VALUE_SIZE)
+        values = memoryview(mapped)[HEADER_SIZE:][:rows * width * VALUE_SIZE]
+        views = {'q': values.cast('q'), 'd': values.cast('d')}
+        columns = {
+            field: views[typecode][index + 1::width]
+            for index, (field, typecode) in enumerate(fields)
+        }
+
+        return ColumnarResults(
+            header['ticker'], header['time_field'], views['q'][0::width],
+            columns, header['timezone'], decode_stamp(header['updated_at']),
+            decode_stamp(header['retrieved_at']),
+            is_datetime=header['is_datetime'],
+            tzinfo=pytz.UTC if header['utc'] else None
+        )
+
+    def save(self, history, results):
+        """Replace the stored results of a ticker."""
+
+        results = to_columnar(history, results)
+        path = self.path(history, results.ticker)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, 'wb') as file:
+            file.write(encode_header(build_header(results)))
+            file.write(encode_rows(results, 0))
+
+    def append(self, history, results):
+        """Append records newer than the stored records of a ticker.
+
+        The stored header is kept apart from the updated and retrieved times,
+        which are left as stored when there are no newer records.
+        """
+
+        results = to_columnar(history, results)
+        path = self.path(history, results.ticker)
+
+        if not os.path.exists(path):
+            return self.save(history, results)
+
+        if not results.times:
+            return
+
+        with open(path, 'r+b') as file:
+            header = read_header(file)
+            width = (len(header['fields']) + 1) * VALUE_SIZE
+            rows = (file.seek(0, os.SEEK_END) - HEADER_SIZE) // width
+            start = 0
+
+            if rows:
+                check_layout(header, results)
+                file.seek(HEADER_SIZE + (rows - 1) * width)
+                last, = struct.unpack('=q', file.read(VALUE_SIZE))
+                start = bisect_right(results.times, last)
+                header.update(
+                    updated_at=encode_stamp(results.updated_at),
+                    retrieved_at=encode_stamp(results.retrieved_at),
+                )
+            else:
+                header = build_header(results)
+
+            # drop a partial row left by an interrupted append
+            file.truncate(HEADER_SIZE + rows * width)
+
+            if start == len(results.times):
+                return
+
+            file.seek(0, os.SEEK_END)
+            file.write(encode_rows(results, start))
+            file.seek(0)
+            file.write(encode_header(header))
+
+
+def to_columnar(history, results):
+    if isinstance(results, ColumnarResults):
+        return results
+
+    return ColumnarResults.from_records(
+        results.ticker, results.records, history.time_field, results.timezone,
+        results.updated_at, results.retrieved_at
+    )
+
+
+def get_fields(results):
+    """Stored [field, typecode] pairs of columns."""
+
+    return [
+        [field, getattr(column, 'typecode', None) or column.format]
+        for field, column in results.columns.items()
+    ]
+
+
+def check_layout(header, results):
+    """Raise ValueError when results cannot be appended to a stored file."""
+
+    layout = {
+        'fields': get_fields(results),
+        'is_datetime': results.is_datetime,
+        'utc': results.tzinfo is not None,
+    }
+
+    for key, value in layout.items():
+        if header[key] != value:
+            raise ValueError(
+                f'{results.ticker} {key} {value} does not match the stored '
+                f'{key} {header[key]}'
+            )
+
+
+def build_header(results):
+    return {
+        'version': VERSION,
+        'byteorder': sys.byteorder,
+        'ticker': results.ticker,
+        'time_field': results.time_field,
+        'fields': get_fields(results),
+        'is_datetime': results.is_datetime,
+        'utc': results.tzinfo is not None,
+        'timezone': results.timezone,
+        'updated_at': encode_stamp(results.updated_at),
+        'retrieved_at': encode_stamp(results.retrieved_at),
+    }
+
+
+def encode_header(header):
+    body = MAGIC + json.dumps(header).encode()
+
+    if len(body) > HEADER_SIZE:
+        raise ValueError(f'{header["ticker"]} header exceeds {HEADER_SIZE} bytes')
+
+    return body.ljust(HEADER_SIZE, b' ')
+
+
+def read_header(file):
+    body = file.read(HEADER_SIZE)
+
+    if not body.startswith(MAGIC):
+        raise ValueError(f'{file.name} is not a price history file')
+
+    header = json.loads(body[len(MAGIC):])
+
+    if header['version'] != VERSION or header['byteorder'] != sys.byteorder:
+        raise ValueError(f'{file.name} has an unsupported layout')
+
+    return header
+
+
+def encode_rows(results, start):
+    """Pack the rows of results from start as fixed-width values."""
+
+    columns = list(results.columns.values())
+    row = struct.Struct('=q' + ''.join(t for _, t in get_fields(results)))
+    rows = zip(results.times[start:], *(c[start:] for c in columns))
+
+    return b''.join(row.pack(*values) for values in rows)
@@ -0,0 +1,136 @@
+"""
+Incremental parser for time-series JSON responses.
+
+The response body is decoded one time-series record at a time, so memory is
+bounded by the largest record instead of the whole payload.
+"""
+
+import codecs
+import re
+from json import JSONDecodeError, JSONDecoder
+
+CHUNK_SIZE = 64 * 1024
+
+DECODER = JSONDecoder()
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+class ResponseStream:
+    """Iterate top-level (key, value) items of a JSON object from byte chunks.
+
+    Values of series keys are lazy iterators of (time string, record) pairs
+    which are consumed before the next top-level item is read, like the
+    groups of itertools.groupby.
+    """
+
+    def __init__(self, chunks, series_keys=()):
+        self.chunks = iter(chunks)
+        self.series_keys = set(series_keys)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.position = 0
+        self.exhausted = False
+
+    def __iter__(self):
+        self.expect('{')
+
+        if self.skip() == '}':
+            return
+
+        while True:
+            key = self.decode()
+            self.expect(':')
+
+            if key in self.series_keys:
+                self.expect('{')
+                members = self.iter_members()
+
+                yield key, members
+
+                for _ in members:
+                    pass
+            else:
+                yield key, self.decode()
+
+            if self.expect(',}') == '}':
+                return
+
+    def iter_members(self):
+        """Yield the (key, value) members of the object being read."""
+
+        if self.skip() == '}':
+            self.position += 1
+            return
+
+        while True:
+            key = self.decode()
+            self.expect(':')
+
+            yield key, self.decode()
+
+            if self.expect(',}') == '}':
+                return
+
+    def read(self):
+        """Append the next chunk to the unread buffer."""
+
+        if self.exhausted:
+            return False
+
+        chunk = next(self.chunks, None)
+
+        if chunk is None:
+            self.exhausted = True
+            text = self.decoder.decode(b'', final=True)
+        else:
+            text = self.decoder.decode(chunk)
+
+        self.buffer = self.buffer[self.position:] + text
+        self.position = 0
+
+        return True
+
+    def skip(self):
+        """Skip whitespace and return the next character, empty at the end."""
+
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+
+            if not self.read():
+                return ''
+
+    def expect(self, characters):
+        character = self.skip()
+
+        if not character or character not in characters:
+            raise JSONDecodeError(
+                f'Expecting one of {characters!r}', self.buffer, self.position
+            )
+
+        self.position += 1
+
+        return character
+
+    def decode(self):
+        """Decode the next complete JSON value."""
+
+        self.skip()
+
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.buffer, self.position)
+            except JSONDecodeError:
+                if not self.read():
+                    raise
+                continue
+
+            # a value ending the buffer may continue in the next chunk
+            if end == len(self.buffer) and self.read():
+                continue
+
+            self.position = end
+
+            return value
@@ -8,6 +8,8 @@ https://help.yahoo.com/kb/SLN2310.html
 https://www.reuters.com/finance/stocks/lookup
 """
 
+from functools import lru_cache
+
 
 # Factset exchange code to RIC suffix
 FACTSET_EXCHANGE_TO_SUFFIX_MAP = {
@@ -73,6 +75,26 @@ FACTSET_EXCHANGE_TO_SUFFIX_MAP = {
 }
 
 
+def build_suffix_map(exchange_map):
+    """Map RIC suffixes to their exchange codes.
+
+    Suffixes map to tuples since several exchanges share a suffix, e.g. the
+    US exchanges without one.
+    """
+
+    suffix_map = {}
+
+    for exchange_code, suffix in sorted(exchange_map.items()):
+        suffix_map[suffix] = suffix_map.get(suffix, ()) + (exchange_code,)
+
+    return suffix_map
+
+
+# RIC suffix to Factset exchange codes, None for US exchanges
+SUFFIX_TO_FACTSET_EXCHANGES_MAP = build_suffix_map(FACTSET_EXCHANGE_TO_SUFFIX_MAP)
+
+
+@lru_cache(maxsize=None)
 def format_ric_ticker(ticker, exchange_code):
     """Format RIC ticker from Factset exchange code."""
 
@@ -82,3 +104,39 @@ def format_ric_ticker(ticker, exchange_code):
         ticker = f'{ticker}.{suffix}'
 
     return ticker
+
+
+@lru_cache(maxsize=None)
+def parse_ric_ticker(ric):
+    """Split a RIC ticker into (ticker, suffix).
+
+    Only known suffixes are split off, so class shares like BRK.B keep their
+    share class with a None suffix.
+    """
+
+    ticker, _, suffix = ric.rpartition('.')
+
+    if ticker and suffix in SUFFIX_TO_FACTSET_EXCHANGES_MAP:
+        return ticker, suffix
+
+    return ric, None
+
+
+def get_factset_exchanges(ric):
+    """Factset exchange codes a RIC ticker may be listed on."""
+
+    _, suffix = parse_ric_ticker(ric)
+
+    return SUFFIX_TO_FACTSET_EXCHANGES_MAP[suffix]
+
+
+def format_ric_tickers(tickers, exchange_codes):
+    """Format RIC tickers from tickers and their Factset exchange codes."""
+
+    return list(map(format_ric_ticker, tickers, exchange_codes))
+
+
+def parse_ric_tickers(rics):
+    """Split RIC tickers into (ticker, suffix) pairs."""
+
+    return list(map(parse_ric_ticker, rics))
@@ -1,14 +1,91 @@
 from datetime import datetime
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from alphavantage.cache import ResponseCache
+from alphavantage.decoding import DECODER, Decoder
+from alphavantage.instrumentation import (
+    CACHE_HIT, DECODE, NULL_INSTRUMENTATION, PAYLOAD_BYTES, RATE_LIMIT_WAIT,
+    REQUEST, Instrumentation
+)
+from alphavantage.rate_limit import RATE_LIMITER, RateLimiter
 from alphavantage.reference import BASE_URL
 
+DEFAULT_POOL_SIZE = 10
 
-def get(session: requests.Session, parameters=None, url=BASE_URL):
-    """Request data as JSON."""
 
-    response = session.get(url, params=parameters)
+def create_session(pool_size=DEFAULT_POOL_SIZE, keep_alive=True):
+    """Create a session with a connection pool to share between threads."""
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+
+    return session
+
+
+def get(session: requests.Session, parameters=None, url=BASE_URL,
+        limiter: RateLimiter = RATE_LIMITER, cache: ResponseCache = None,
+        instrumentation: Instrumentation = NULL_INSTRUMENTATION,
+        decoder: Decoder = DECODER):
+    """Request data as JSON, decoded from the undecoded body by decoder."""
+
+    body, retrieved_at = fetch(session, parameters, url, limiter, cache,
+                               instrumentation)
+
+    with instrumentation.timed(DECODE, (parameters or {}).get('symbol')):
+        data = decoder(body)
+
+    return data, retrieved_at
+
+
+def fetch(session: requests.Session, parameters=None, url=BASE_URL,
+          limiter: RateLimiter = RATE_LIMITER, cache: ResponseCache = None,
+          instrumentation: Instrumentation = NULL_INSTRUMENTATION):
+    """Request the undecoded response body."""
+
+    ticker = (parameters or {}).get('symbol')
+
+    if cache is not None:
+        cached = cache.get(parameters)
+        instrumentation.emit(CACHE_HIT, int(cached is not None), ticker)
+
+        if cached is not None:
+            return cached
+
+    instrumentation.emit(RATE_LIMIT_WAIT, limiter.acquire(), ticker)
+
+    with instrumentation.timed(REQUEST, ticker):
+        response = session.get(url, params=parameters)
+
+    retrieved_at = datetime.utcnow()
+    response.raise_for_status()
+    body = response.content
+    instrumentation.emit(PAYLOAD_BYTES, len(body), ticker)
+
+    if cache is not None:
+        cache.set(parameters, body, retrieved_at)
+
+    return body, retrieved_at
+
+
+def stream(session: requests.Session, parameters=None, url=BASE_URL,
+           limiter: RateLimiter = RATE_LIMITER,
+           instrumentation: Instrumentation = NULL_INSTRUMENTATION):
+    """Request data as a streamed response."""
+
+    ticker = (parameters or {}).get('symbol')
+    instrumentation.emit(RATE_LIMIT_WAIT, limiter.acquire(), ticker)
+
+    with instrumentation.timed(REQUEST, ticker):
+        response = session.get(url, params=parameters, stream=True)
+
     retrieved_at = datetime.utcnow()
+    response.raise_for_status()
 
-    return response.json(), retrieved_at
+    return response, retrieved_at
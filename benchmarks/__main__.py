@@ -0,0 +1,142 @@
+"""
+Offline benchmarks of the response parsing pipeline.
+
+Reports the time and peak traced memory of each parsing stage over
+synthetic responses::
+
+    python -m benchmarks
+    python -m benchmarks intraday --repeat 5
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from alphavantage.decoding import DECODER
+from alphavantage.price_history import (
+    AdjustedPriceHistory, IntradayPriceHistory, PriceHistory
+)
+from alphavantage.streaming import CHUNK_SIZE
+from benchmarks.payloads import (
+    batch_payloads, daily_payload, encode, intraday_payload
+)
+
+MEBIBYTE = 1024 * 1024
+
+
+def chunk(body):
+    return [body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+
+
+def build_stages(history, bodies):
+    """Benchmark stages as (name, setup, run) over response bodies.
+
+    setup builds fresh inputs for each run since stages mutate records.
+    """
+
+    responses = [json.loads(body) for body in bodies]
+    series = [response[history.data_key] for response in responses]
+    timezone = responses[0]['Meta Data'][
+        next(k for k in responses[0]['Meta Data'] if k.endswith('Time Zone'))
+    ]
+
+    def transformed():
+        return [list(history.transform_records(s)) for s in series]
+
+    def converted():
+        return [list(history.convert_timezones(records, timezone))
+                for records in transformed()]
+
+    return [
+        ('decode', lambda: bodies,
+         lambda items: [json.loads(body) for body in items]),
+        ('decode_configured', lambda: bodies,
+         lambda items: [DECODER(body) for body in items]),
+        ('rename_keys', lambda: [list(s.values()) for s in series],
+         lambda items: [[history.adapt_data(r) for r in raw] for raw in items]),
+        ('parse_record',
+         lambda: [[history.adapt_data(r) for r in s.values()] for s in series],
+         lambda items: [[history.parse_record(r) for r in raw] for raw in items]),
+        ('transform_records', lambda: series,
+         lambda items: [list(history.transform_records(s)) for s in items]),
+        ('convert_timezones', transformed,
+         lambda items: [list(history.convert_timezones(records, timezone))
+                        for records in items]),
+        ('sort_records', converted,
+         lambda items: [history.sort_records(records) for records in items]),
+        ('get_results', lambda: bodies,
+         lambda items: [history.get_results('T', json.loads(body), None)
+                        for body in items]),
+        ('stream', lambda: [chunk(body) for body in bodies],
+         lambda items: [history.get_stream_results('T', chunks, None)
+                        for chunks in items]),
+    ]
+
+
+def measure(setup, run, repeat):
+    """Best time and peak traced allocation of a stage."""
+
+    elapsed = []
+
+    for _ in range(repeat):
+        items = setup()
+        start = time.perf_counter()
+        run(items)
+        elapsed.append(time.perf_counter() - start)
+
+    items = setup()
+    tracemalloc.start()
+    run(items)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(elapsed), peak
+
+
+def build_scenarios(tickers):
+    """Scenario titles, histories and response body factories by name."""
+
+    return {
+        'daily': ('20 year daily adjusted', AdjustedPriceHistory(),
+                  lambda: [encode(daily_payload(years=20))]),
+        'intraday': ('full 1 minute intraday', IntradayPriceHistory(),
+                     lambda: [encode(intraday_payload(days=30))]),
+        'batch': (f'{tickers} ticker daily batch', PriceHistory(),
+                  lambda: [encode(p) for p in batch_payloads(tickers)]),
+    }
+
+
+def report(title, stages, repeat):
+    print(f'\n{title}')
+    print(f'{"stage":<20}{"seconds":>10}{"peak MiB":>12}')
+
+    for name, setup, run in stages:
+        elapsed, peak = measure(setup, run, repeat)
+        print(f'{name:<20}{elapsed:>10.4f}{peak / MEBIBYTE:>12.2f}')
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('scenarios', nargs='*', metavar='scenario',
+                        help='daily, intraday or batch, all by default')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--tickers', type=int, default=1000)
+    options = parser.parse_args(args)
+
+    scenarios = build_scenarios(options.tickers)
+    unknown = set(options.scenarios) - set(scenarios)
+
+    if unknown:
+        parser.error(f'unknown scenarios: {", ".join(sorted(unknown))}')
+
+    for name in options.scenarios or scenarios:
+        title, history, build_bodies = scenarios[name]
+        bodies = build_bodies()
+        bars = sum(len(json.loads(body)[history.data_key]) for body in bodies)
+        report(f'{title}, {bars} bars', build_stages(history, bodies),
+               options.repeat)
+
+
+if __name__ == '__main__':
+    main()
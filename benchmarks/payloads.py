@@ -0,0 +1,125 @@
+"""Synthetic Alpha Vantage responses at production sizes."""
+
+import json
+import random
+from datetime import date, datetime, timedelta
+
+from alphavantage.price_history import (
+    ADJUSTED_RESPONSE_KEY_MAP, INTRADAY_RESPONSE_KEY_MAP, RESPONSE_KEY_MAP,
+    AdjustedPriceHistory, PriceHistory, build_field_names
+)
+from alphavantage.reference import DAILY
+
+TIMEZONE = 'US/Eastern'
+SESSION_MINUTES = 390
+
+
+def trading_days(end: date, count: int):
+    """Weekdays ending on end in descending order."""
+
+    day = end
+
+    while count:
+        if day.weekday() < 5:
+            yield day
+            count -= 1
+
+        day -= timedelta(days=1)
+
+
+def generate_bar(rng, price, adjusted=False):
+    """Random OHLCV values around a price as response strings."""
+
+    close = price * (1 + rng.gauss(0, 0.01))
+    high = max(price, close) * (1 + abs(rng.gauss(0, 0.005)))
+    low = min(price, close) * (1 - abs(rng.gauss(0, 0.005)))
+    values = [price, high, low, close]
+
+    if adjusted:
+        values.append(close)
+
+    values = [f'{value:.4f}' for value in values]
+    values.append(str(rng.randint(100, 10 ** 7)))
+
+    if adjusted:
+        dividend = rng.random() < 1 / 63
+        split = rng.random() < 1 / 2520
+        values.append(f'{0.5 if dividend else 0:.4f}')
+        values.append(f'{2 if split else 1:.4f}')
+
+    return close, values
+
+
+def build_meta(ticker, last_refreshed, information, interval=None):
+    meta = {
+        '1. Information': information,
+        '2. Symbol': ticker,
+        '3. Last Refreshed': last_refreshed,
+    }
+
+    if interval:
+        meta['4. Interval'] = interval
+
+    meta[f'{len(meta) + 1}. Output Size'] = 'Full size'
+    meta[f'{len(meta) + 1}. Time Zone'] = TIMEZONE
+
+    return meta
+
+
+def daily_payload(ticker='MSFT', years=20, adjusted=True, seed=0,
+                  end=date(2018, 5, 25)):
+    """Daily series covering years of trading days."""
+
+    rng = random.Random(seed)
+    cls = AdjustedPriceHistory if adjusted else PriceHistory
+    field_names = list(build_field_names(cls.FIELDS))
+    key_map = ADJUSTED_RESPONSE_KEY_MAP if adjusted else RESPONSE_KEY_MAP
+    price = 100.0
+    series = {}
+
+    for day in trading_days(end, years * 252):
+        price, values = generate_bar(rng, price, adjusted)
+        series[day.isoformat()] = dict(zip(field_names, values))
+
+    meta = build_meta(ticker, end.isoformat(), 'Daily Prices')
+
+    return {'Meta Data': meta, key_map[DAILY]: series}
+
+
+def intraday_payload(ticker='MSFT', days=30, interval=1, seed=0,
+                     end=date(2018, 5, 30)):
+    """Intraday series covering days of regular sessions."""
+
+    rng = random.Random(seed)
+    field_names = list(build_field_names(PriceHistory.FIELDS))
+    price = 100.0
+    series = {}
+
+    for day in trading_days(end, days):
+        close = datetime.combine(day, datetime.min.time()) + timedelta(hours=16)
+
+        for minute in range(0, SESSION_MINUTES, interval):
+            timestamp = close - timedelta(minutes=minute)
+            price, values = generate_bar(rng, price)
+            series[str(timestamp)] = dict(zip(field_names, values))
+
+    last_refreshed = str(datetime.combine(end, datetime.min.time()) +
+                         timedelta(hours=16))
+    meta = build_meta(ticker, last_refreshed, 'Intraday Prices',
+                      interval=f'{interval}min')
+
+    return {'Meta Data': meta, INTRADAY_RESPONSE_KEY_MAP[interval]: series}
+
+
+def batch_payloads(tickers=1000, years=1, seed=0):
+    """Daily series for a universe of tickers."""
+
+    for index in range(tickers):
+        yield daily_payload(f'T{index:04d}', years=years, adjusted=False,
+                            seed=seed + index)
+
+
+def encode(payload) -> bytes:
+    """Response body as served, indented JSON."""
+
+    return json.dumps(payload, indent=4).encode()
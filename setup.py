@@ -27,7 +27,7 @@ def get_readme(readme_file: str):
 
 
 setup(name=PACKAGE_NAME,
-      packages=find_packages(exclude=('tests',)),
+      packages=find_packages(exclude=('tests', 'benchmarks')),
       package_data={'': ['*.txt', '*.json']},
       include_package_data=True,
       version=version_ns['__version__'],
@@ -47,6 +47,8 @@ setup(name=PACKAGE_NAME,
       author_email='philip.martin@censible.co',
       install_requires=get_requirements('requirements.txt'),
       extras_require={
-          'test': get_requirements('requirements-test.txt')
+          'test': get_requirements('requirements-test.txt'),
+          'async': ['aiohttp'],
+          'fast': ['orjson']
       },
       zip_safe=False)
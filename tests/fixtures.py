@@ -1,3 +1,6 @@
+import asyncio
+import json
+
 
 # daily price response
 MOCK_META = {
@@ -117,3 +120,119 @@ MOCK_INTRADAY_RESPONSE = {
     "Meta Data": MOCK_META_INTRADAY,
     "Time Series (1min)": MOCK_INTRADAY_RECORDS
 }
+
+
+# csv responses, which have no meta data
+MOCK_DAILY_CSV = (
+    'timestamp,open,high,low,close,volume\r\n'
+    '2018-05-25,98.3000,98.9800,97.8600,98.3600,18363918\r\n'
+    '2018-05-24,98.7250,98.9400,96.8100,98.3100,26649287\r\n'
+)
+
+MOCK_ADJUSTED_CSV = (
+    'timestamp,open,high,low,close,adjusted_close,volume,dividend_amount,'
+    'split_coefficient\r\n'
+    '2018-05-25,98.3000,98.9800,97.8600,98.3600,98.3600,17942632,0.0000,1.0000\r\n'
+    '2018-05-24,98.7250,98.9400,96.8100,98.3100,98.3100,26649287,0.0000,1.0000\r\n'
+    '2018-05-23,96.7100,98.7300,96.3200,98.6600,98.6600,21251222,0.0000,1.0000\r\n'
+)
+
+MOCK_INTRADAY_CSV = (
+    'timestamp,open,high,low,close,volume\r\n'
+    '2018-05-30 16:00:00,99.0000,99.0500,98.9100,98.9500,2233252\r\n'
+    '2018-05-30 15:59:00,99.0350,99.0500,99.0000,99.0000,156349\r\n'
+    '2018-05-30 15:58:00,98.9900,99.0600,98.9900,99.0300,142621\r\n'
+)
+
+
+# batch quotes response
+MOCK_BATCH_QUOTES_RESPONSE = {
+    "Meta Data": {
+        "1. Information": "Batch Stock Market Quotes",
+        "2. Notes": "IEX Real-Time Price provided for free by IEX",
+        "3. Time Zone": "US/Eastern"
+    },
+    "Stock Quotes": [
+        {
+            "1. symbol": "MSFT",
+            "2. price": "98.3600",
+            "3. volume": "18363918",
+            "4. timestamp": "2018-05-25 16:00:00"
+        },
+        {
+            "1. symbol": "AAPL",
+            "2. price": "188.5800",
+            "3. volume": "--",
+            "4. timestamp": "2018-05-25 15:59:58"
+        }
+    ]
+}
+
+
+class MockResponse:
+    """Response with a JSON body, usable as a requests or aiohttp response."""
+
+    def __init__(self, payload, read_delay=0):
+        self.payload = payload
+        self.content = json.dumps(payload).encode()
+        self.read_delay = read_delay
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        if self.read_delay:
+            await asyncio.sleep(self.read_delay)
+
+        return self.content
+
+
+class MockSession:
+    """Session answering each request with a payload and recording its params.
+
+    Payloads come from respond(params) when given, else payloads by symbol,
+    else the single payload.
+    """
+
+    def __init__(self, payload=None, payloads=None, respond=None, read_delay=0):
+        self.payload = payload
+        self.payloads = payloads
+        self.respond = respond or self.lookup
+        self.read_delay = read_delay
+        self.requests = []
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def calls(self):
+        return len(self.requests)
+
+    def requested(self, field):
+        """Values of a parameter in request order."""
+
+        return [params.get(field) for params in self.requests]
+
+    def lookup(self, params):
+        if self.payloads is None:
+            return self.payload
+
+        return self.payloads[params['symbol']]
+
+    def get(self, url, params=None):
+        self.requests.append(dict(params or {}))
+
+        return MockResponse(self.respond(params), self.read_delay)
+
+    def close(self):
+        self.closed = True
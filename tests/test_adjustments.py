@@ -0,0 +1,81 @@
+import unittest
+from datetime import date
+
+from alphavantage.adjustments import Adjustments, adjust
+from alphavantage.price_history import (
+    AdjustedPriceHistory, PriceHistory, Results, filter_dividends,
+    filter_splits
+)
+from tests.fixtures import MOCK_ADJUSTED_PRICE_RESPONSE
+
+
+def record(day, close):
+    return {'as_of_date': day, 'close': close}
+
+
+RECORDS = [
+    record(date(2018, 5, 21), 100.0),
+    record(date(2018, 5, 22), 50.0),
+    record(date(2018, 5, 23), 49.0),
+    record(date(2018, 5, 24), 50.0),
+]
+
+
+class TestAdjustments(unittest.TestCase):
+    def test_no_events(self):
+        adjustments = Adjustments(RECORDS)
+
+        self.assertEqual([1.0] * 4, adjustments.factors)
+
+    def test_split_and_dividend(self):
+        adjustments = Adjustments(
+            RECORDS, splits=[(date(2018, 5, 22), 2.0)],
+            dividends=[(date(2018, 5, 23), 1.0)]
+        )
+
+        expected = [0.5 * 0.98, 0.98, 1.0, 1.0]
+
+        for expected_factor, factor in zip(expected, adjustments.factors):
+            self.assertAlmostEqual(expected_factor, factor)
+
+        records = list(adjustments.adjusted_records())
+
+        self.assertAlmostEqual(49.0, records[0]['adjusted_close'])
+        self.assertEqual(2.0, records[1]['split_coefficient'])
+        self.assertEqual(1.0, records[2]['dividend_amount'])
+        self.assertEqual(0.0, records[3]['dividend_amount'])
+
+    def test_event_between_records(self):
+        adjustments = Adjustments(RECORDS, splits=[(date(2018, 5, 26), 4.0)])
+
+        self.assertEqual([0.25] * 4, adjustments.factors)
+
+    def test_added_events_match_recomputed(self):
+        splits = [(date(2018, 5, 22), 2.0)]
+        dividends = [(date(2018, 5, 23), 1.0)]
+        adjustments = Adjustments(RECORDS[:3])
+
+        adjustments.append(RECORDS[3:])
+        adjustments.add_split(*splits[0])
+        adjustments.add_dividend(*dividends[0])
+
+        expected = Adjustments(RECORDS, splits, dividends)
+
+        for expected_factor, factor in zip(expected.factors, adjustments.factors):
+            self.assertAlmostEqual(expected_factor, factor)
+
+    def test_adjust_matches_adjusted_history(self):
+        adjusted = AdjustedPriceHistory().get_results(
+            'MSFT', MOCK_ADJUSTED_PRICE_RESPONSE, None
+        )
+        raw = Results('MSFT', [
+            {k: v for k, v in r.items()
+             if k in PriceHistory.FIELDS or k == 'as_of_date'}
+            for r in adjusted.records
+        ], adjusted.timezone, adjusted.updated_at, None)
+
+        result = adjust(raw, filter_splits(adjusted.records),
+                        filter_dividends(adjusted.records))
+
+        self.assertEqual(adjusted.records, result.records)
+        self.assertEqual(adjusted.updated_at, result.updated_at)
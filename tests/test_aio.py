@@ -0,0 +1,186 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import unittest
+from datetime import date
+
+from alphavantage.aio import (
+    AsyncPriceHistory, AsyncIntradayPriceHistory, get_outcomes, get_results
+)
+from alphavantage.exceptions import InvalidRequestError, ThrottledError
+from alphavantage.cache import ResponseCache
+from alphavantage.price_history import PriceHistory
+from alphavantage.retry import RetryPolicy
+from tests.fixtures import (
+    MOCK_DAILY_PRICE_RESPONSE, MOCK_INTRADAY_RESPONSE, MockSession
+)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsyncPriceHistory(unittest.TestCase):
+    def test_get(self):
+        session = MockSession(payloads={'MSFT': MOCK_DAILY_PRICE_RESPONSE})
+        history = AsyncPriceHistory(api_key='my_fake_key', session=session)
+
+        result = run(history.get('MSFT'))
+        expected = PriceHistory().get_results(
+            'MSFT', MOCK_DAILY_PRICE_RESPONSE, result.retrieved_at
+        )
+
+        self.assertEqual(expected.records, result.records)
+        self.assertEqual(date(2018, 5, 25), result.updated_at)
+        self.assertEqual('my_fake_key', session.requests[0]['apikey'])
+
+    def test_intraday_get(self):
+        session = MockSession(payloads={'MSFT': MOCK_INTRADAY_RESPONSE})
+        history = AsyncIntradayPriceHistory(session=session)
+
+        result = run(history.get('MSFT'))
+
+        self.assertEqual(3, len(result.records))
+        self.assertEqual('1min', session.requests[0]['interval'])
+
+
+    def test_fetch(self):
+        session = MockSession(MOCK_DAILY_PRICE_RESPONSE)
+        history = AsyncPriceHistory(session=session)
+
+        body, _ = run(history.fetch('MSFT'))
+
+        self.assertEqual(MOCK_DAILY_PRICE_RESPONSE, json.loads(body))
+
+    def test_sync(self):
+        session = MockSession(MOCK_DAILY_PRICE_RESPONSE)
+        history = AsyncPriceHistory(session=session)
+        latest = run(history.get('MSFT'))
+        stored = PriceHistory().create_results(
+            'MSFT', latest.records[:1], latest.timezone, None, None
+        )
+
+        result = run(history.sync('MSFT', stored))
+
+        self.assertEqual(latest.records, result.records)
+        self.assertEqual(latest.updated_at, result.updated_at)
+        self.assertEqual(['compact', 'compact'], session.requested('outputsize'))
+
+    def test_stream_not_supported(self):
+        with self.assertRaises(NotImplementedError):
+            AsyncPriceHistory(session=MockSession()).stream('MSFT')
+
+class ThreadRecordingCache(ResponseCache):
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = []
+
+    def get(self, parameters):
+        self.threads.append(threading.current_thread())
+
+        return super().get(parameters)
+
+    def set(self, parameters, body, retrieved_at):
+        self.threads.append(threading.current_thread())
+        super().set(parameters, body, retrieved_at)
+
+
+class TestAsyncCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        path = os.path.join(self.directory.name, 'cache.db')
+        self.cache = ThreadRecordingCache(path)
+        self.cache.clock = lambda: 0
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_cache_off_loop(self):
+        session = MockSession(payloads={'MSFT': MOCK_DAILY_PRICE_RESPONSE})
+        history = AsyncPriceHistory(session=session, cache=self.cache)
+
+        first = run(history.get('MSFT'))
+        second = run(history.get('MSFT'))
+
+        self.assertEqual(first.records, second.records)
+        self.assertEqual(1, len(session.requests))
+        self.assertEqual(3, len(self.cache.threads))
+        self.assertNotIn(threading.current_thread(), self.cache.threads)
+
+
+class TestGetResults(unittest.TestCase):
+    def test_get_results(self):
+        session = MockSession(payloads={
+            'MSFT': MOCK_DAILY_PRICE_RESPONSE,
+            'FAKE': {'Error Message': 'Invalid API call.'}
+        })
+
+        async def collect():
+            return {
+                ticker: results async for ticker, results in get_results(
+                    AsyncPriceHistory, ['MSFT', 'FAKE'], {}, session=session
+                )
+            }
+
+        results = run(collect())
+
+        self.assertEqual(['MSFT'], list(results))
+        self.assertEqual(2, len(session.requests))
+
+    def test_get_outcomes_retries_throttled(self):
+        def respond(params):
+            if params['symbol'] == 'BUSY' and session.requested('symbol') == ['BUSY']:
+                return {'Note': 'Thank you for using Alpha Vantage!'}
+
+            return MOCK_DAILY_PRICE_RESPONSE
+
+        session = MockSession(respond=respond)
+        waits = []
+
+        async def sleep(seconds):
+            waits.append(seconds)
+
+        async def collect():
+            return {
+                outcome.ticker: outcome async for outcome in get_outcomes(
+                    AsyncPriceHistory, ['BUSY'], {}, session=session,
+                    retry=RetryPolicy(jitter=lambda: 1), sleep=sleep
+                )
+            }
+
+        outcomes = run(collect())
+
+        self.assertTrue(outcomes['BUSY'].ok)
+        self.assertEqual(2, outcomes['BUSY'].attempts)
+        self.assertEqual([61], waits)
+
+    def test_get_outcomes_reports_errors(self):
+        session = MockSession(payloads={
+            'FAKE': {'Error Message': 'Invalid API call.'},
+            'BUSY': {'Note': 'Thank you for using Alpha Vantage!'}
+        })
+
+        async def sleep(seconds):
+            pass
+
+        async def collect():
+            return {
+                outcome.ticker: outcome async for outcome in get_outcomes(
+                    AsyncPriceHistory, ['FAKE', 'BUSY'], {}, session=session,
+                    retry=RetryPolicy(max_attempts=2), sleep=sleep
+                )
+            }
+
+        outcomes = run(collect())
+
+        self.assertIsInstance(outcomes['FAKE'].error, InvalidRequestError)
+        self.assertEqual(1, outcomes['FAKE'].attempts)
+        self.assertIsInstance(outcomes['BUSY'].error, ThrottledError)
+        self.assertEqual(2, outcomes['BUSY'].attempts)
@@ -0,0 +1,35 @@
+import json
+import unittest
+
+from alphavantage.price_history import AdjustedPriceHistory, IntradayPriceHistory
+from benchmarks.payloads import (
+    batch_payloads, daily_payload, encode, intraday_payload
+)
+
+
+class TestPayloads(unittest.TestCase):
+    def test_daily_payload(self):
+        history = AdjustedPriceHistory()
+        response = json.loads(encode(daily_payload(years=1)))
+
+        result = history.get_results('MSFT', response, None)
+        dates = [r['as_of_date'] for r in result.records]
+
+        self.assertEqual(252, len(dates))
+        self.assertEqual(sorted(dates), dates)
+        self.assertEqual(dates[-1], result.updated_at)
+
+    def test_intraday_payload(self):
+        history = IntradayPriceHistory(interval=5)
+        response = intraday_payload(days=2, interval=5)
+
+        result = history.get_results('MSFT', response, None)
+
+        self.assertEqual(2 * 78, len(result.records))
+        self.assertEqual(result.records[-1]['as_of_time'], result.updated_at)
+
+    def test_batch_payloads(self):
+        payloads = list(batch_payloads(tickers=3, years=1))
+        symbols = [payload['Meta Data']['2. Symbol'] for payload in payloads]
+
+        self.assertEqual(['T0000', 'T0001', 'T0002'], symbols)
@@ -0,0 +1,129 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+import pytz
+
+from alphavantage import web
+from alphavantage.cache import ResponseCache, cache_key, get_expiry
+from alphavantage.dates import next_session_time, MARKET_CLOSE
+from tests.fixtures import (
+    MOCK_DAILY_PRICE_RESPONSE, MOCK_INTRADAY_RESPONSE, MockSession
+)
+
+DAILY_PARAMETERS = {
+    'function': 'TIME_SERIES_DAILY',
+    'symbol': 'MSFT',
+    'apikey': 'my_fake_key',
+    'outputsize': 'compact'
+}
+
+INTRADAY_PARAMETERS = dict(DAILY_PARAMETERS, function='TIME_SERIES_INTRADAY',
+                           interval='1min')
+
+DAILY_BODY = json.dumps(MOCK_DAILY_PRICE_RESPONSE).encode()
+
+
+class TestExpiry(unittest.TestCase):
+    def test_next_session_time_skips_weekend(self):
+        friday_close = datetime(2018, 5, 25, 16, 0)
+
+        expected = datetime(2018, 5, 28, 16, 0)
+        result = next_session_time(friday_close, MARKET_CLOSE)
+
+        self.assertEqual(expected, result)
+
+    def test_cache_key_ignores_api_key(self):
+        parameters = dict(DAILY_PARAMETERS, apikey='other', symbol='msft')
+
+        self.assertEqual(cache_key(DAILY_PARAMETERS), cache_key(parameters))
+
+    def test_daily_expires_next_close(self):
+        expected = datetime(2018, 5, 28, 20, 0, tzinfo=pytz.UTC)
+        result = get_expiry(MOCK_DAILY_PRICE_RESPONSE['Meta Data'],
+                            DAILY_PARAMETERS)
+
+        self.assertEqual(expected, result)
+
+    def test_intraday_after_close_expires_after_next_open(self):
+        expected = datetime(2018, 5, 31, 13, 31, tzinfo=pytz.UTC)
+        result = get_expiry(MOCK_INTRADAY_RESPONSE['Meta Data'],
+                            INTRADAY_PARAMETERS)
+
+        self.assertEqual(expected, result)
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache.db')
+        self.now = datetime(2018, 5, 26, tzinfo=pytz.UTC).timestamp()
+        self.cache = ResponseCache(self.path, clock=lambda: self.now)
+        self.retrieved_at = datetime(2018, 5, 26, 1, 2, 3, 4)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get(DAILY_PARAMETERS))
+
+    def test_set_get(self):
+        self.cache.set(DAILY_PARAMETERS, DAILY_BODY, self.retrieved_at)
+
+        expected = (DAILY_BODY, self.retrieved_at)
+        result = self.cache.get(DAILY_PARAMETERS)
+
+        self.assertEqual(expected, result)
+
+    def test_shared_between_instances(self):
+        self.cache.set(DAILY_PARAMETERS, DAILY_BODY, self.retrieved_at)
+        other = ResponseCache(self.path, clock=lambda: self.now)
+
+        self.assertIsNotNone(other.get(DAILY_PARAMETERS))
+
+    def test_expired(self):
+        self.cache.set(DAILY_PARAMETERS, DAILY_BODY, self.retrieved_at)
+        self.now = datetime(2018, 5, 28, 20, 0, tzinfo=pytz.UTC).timestamp()
+
+        self.assertIsNone(self.cache.get(DAILY_PARAMETERS))
+
+    def test_ignores_error_payload(self):
+        self.cache.set(DAILY_PARAMETERS, b'{"Note": "Thank you for using"}',
+                       self.retrieved_at)
+
+        self.assertIsNone(self.cache.get(DAILY_PARAMETERS))
+
+    def test_evicts_least_recently_used(self):
+        size = len(DAILY_BODY)
+        self.cache.max_bytes = size * 2
+        aapl = dict(DAILY_PARAMETERS, symbol='AAPL')
+        ibm = dict(DAILY_PARAMETERS, symbol='IBM')
+
+        self.cache.set(DAILY_PARAMETERS, DAILY_BODY, self.retrieved_at)
+        self.now += 1
+        self.cache.set(aapl, DAILY_BODY, self.retrieved_at)
+        self.now += 1
+        self.cache.get(DAILY_PARAMETERS)
+        self.now += 1
+        self.cache.set(ibm, DAILY_BODY, self.retrieved_at)
+
+        self.assertIsNone(self.cache.get(aapl))
+        self.assertIsNotNone(self.cache.get(DAILY_PARAMETERS))
+        self.assertIsNotNone(self.cache.get(ibm))
+
+    def test_ignores_malformed_body(self):
+        self.cache.set(DAILY_PARAMETERS, b'<html>', self.retrieved_at)
+
+        self.assertIsNone(self.cache.get(DAILY_PARAMETERS))
+
+    def test_web_get_uses_cache(self):
+        session = MockSession(MOCK_DAILY_PRICE_RESPONSE)
+
+        first, retrieved_at = web.get(session, DAILY_PARAMETERS, cache=self.cache)
+        second, cached_at = web.get(session, DAILY_PARAMETERS, cache=self.cache)
+
+        self.assertEqual(1, session.calls)
+        self.assertEqual(first, second)
+        self.assertEqual(retrieved_at, cached_at)
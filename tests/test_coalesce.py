@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from alphavantage.aio import AsyncPriceHistory
+from alphavantage.coalesce import SingleFlight
+from alphavantage.price_history import PriceHistory
+from tests.fixtures import MOCK_DAILY_PRICE_RESPONSE, MockSession
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.calls = []
+
+    def slow(self, value):
+        self.calls.append(value)
+        self.started.set()
+        self.release.wait(5)
+
+        if value is None:
+            raise ValueError('no value')
+
+        return [value]
+
+    def call_concurrently(self, value, count=4):
+        with ThreadPoolExecutor(count) as executor:
+            leader = executor.submit(self.single_flight.call, 'key', self.slow,
+                                     value)
+            self.started.wait(5)
+            followers = [
+                executor.submit(self.single_flight.call, 'key', self.slow, value)
+                for _ in range(count - 1)
+            ]
+            # let the followers reach the in-flight call
+            time.sleep(0.1)
+            self.release.set()
+
+            return [leader] + followers
+
+    def test_concurrent_calls_share_result(self):
+        futures = self.call_concurrently(1)
+        results = [future.result() for future in futures]
+
+        self.assertEqual([1], self.calls)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual({}, self.single_flight.calls)
+
+    def test_concurrent_calls_share_error(self):
+        futures = self.call_concurrently(None)
+
+        for future in futures:
+            with self.assertRaises(ValueError):
+                future.result()
+
+        self.assertEqual([None], self.calls)
+
+    def test_sequential_calls_not_shared(self):
+        self.release.set()
+
+        self.single_flight.call('key', self.slow, 1)
+        self.single_flight.call('key', self.slow, 2)
+
+        self.assertEqual([1, 2], self.calls)
+
+    def test_async_calls_share_result(self):
+        calls = []
+
+        async def fetch(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+
+            return [value]
+
+        async def gather():
+            return await asyncio.gather(*(
+                self.single_flight.call_async('key', fetch, 1) for _ in range(3)
+            ))
+
+        loop = asyncio.new_event_loop()
+
+        try:
+            results = loop.run_until_complete(gather())
+        finally:
+            loop.close()
+
+        self.assertEqual([1], calls)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual({}, self.single_flight.tasks)
+
+
+class TestPriceHistory(unittest.TestCase):
+    def test_concurrent_gets_share_request(self):
+        started, release = threading.Event(), threading.Event()
+
+        def respond(params):
+            started.set()
+            release.wait(5)
+
+            return MOCK_DAILY_PRICE_RESPONSE
+
+        session = MockSession(respond=respond)
+        history = PriceHistory(session=session, single_flight=SingleFlight())
+
+        with ThreadPoolExecutor(3) as executor:
+            leader = executor.submit(history.get, 'MSFT')
+            started.wait(5)
+            followers = [executor.submit(history.get, 'MSFT') for _ in range(2)]
+            time.sleep(0.1)
+            release.set()
+            results = [f.result() for f in [leader] + followers]
+
+        self.assertEqual(1, session.calls)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_key_includes_parse_options(self):
+        parameters = PriceHistory().request_parameters('MSFT')
+
+        self.assertNotEqual(
+            PriceHistory().coalesce_key(parameters),
+            PriceHistory(columnar=True).coalesce_key(parameters)
+        )
+        self.assertEqual(
+            PriceHistory(api_key='a').coalesce_key(parameters),
+            PriceHistory(api_key='b').coalesce_key(parameters)
+        )
+
+    def test_async_history(self):
+        session = MockSession(MOCK_DAILY_PRICE_RESPONSE, read_delay=0.01)
+        history = AsyncPriceHistory(session=session, single_flight=SingleFlight())
+
+        async def gather():
+            return await asyncio.gather(*(history.get('MSFT') for _ in range(3)))
+
+        loop = asyncio.new_event_loop()
+
+        try:
+            results = loop.run_until_complete(gather())
+        finally:
+            loop.close()
+
+        self.assertEqual(1, session.calls)
+        self.assertTrue(all(result is results[0] for result in results))
@@ -1,9 +1,11 @@
 import unittest
-from datetime import datetime
+from datetime import date, datetime, timedelta
 
 import pytz
 
-from alphavantage.dates import convert_to_utc
+from alphavantage.dates import (
+    convert_to_utc, parse_date, parse_datetime, utc_converter
+)
 
 
 class TestHelperFunctions(unittest.TestCase):
@@ -22,3 +24,46 @@ class TestHelperFunctions(unittest.TestCase):
         result = convert_to_utc(d, 'US/Eastern')
 
         self.assertEqual(expected, result)
+
+    def test_utc_converter(self):
+        for timezone in ('US/Eastern', 'Europe/London', 'Asia/Tokyo', 'UTC'):
+            convert = utc_converter(timezone)
+
+            for start in (datetime(2018, 3, 9), datetime(2018, 11, 2)):
+                for minutes in range(0, 4 * 24 * 60, 15):
+                    d = start + timedelta(minutes=minutes)
+
+                    self.assertEqual(convert_to_utc(d, timezone), convert(d))
+
+    def test_utc_converter_ambiguous_time(self):
+        d = datetime(2018, 11, 4, 1, 30, 0)
+
+        expected = datetime(2018, 11, 4, 6, 30, 0, tzinfo=pytz.UTC)
+        result = utc_converter('US/Eastern')(d)
+
+        self.assertEqual(expected, result)
+        self.assertEqual(pytz.UTC, result.tzinfo)
+
+    def test_parse_datetime(self):
+        expected = datetime(2018, 5, 30, 15, 59, 0)
+        result = parse_datetime('2018-05-30 15:59:00')
+
+        self.assertEqual(expected, result)
+
+    def test_parse_datetime_formatter(self):
+        expected = datetime(2018, 5, 30, 15, 59, 0)
+        result = parse_datetime('05/30/2018 15:59', formatter='%m/%d/%Y %H:%M')
+
+        self.assertEqual(expected, result)
+
+    def test_parse_date(self):
+        self.assertEqual(date(2018, 5, 30), parse_date('2018-05-30'))
+
+    def test_parse_invalid_layout(self):
+        for d in ('2018-05-30', '2018-05-30T15:59:00', '2018-05-30 15:59'):
+            with self.assertRaises(ValueError):
+                parse_datetime(d)
+
+        for d in ('2018-05-30 15:59:00', '20180530', '2018-5-30'):
+            with self.assertRaises(ValueError):
+                parse_date(d)
@@ -0,0 +1,35 @@
+import json
+import unittest
+
+from alphavantage import web
+from alphavantage.decoding import Decoder, configure_decoder
+from tests.fixtures import MOCK_DAILY_PRICE_RESPONSE, MockSession
+
+
+class TestDecoder(unittest.TestCase):
+    def tearDown(self):
+        configure_decoder()
+
+    def test_decodes_bytes(self):
+        body = json.dumps(MOCK_DAILY_PRICE_RESPONSE).encode()
+
+        self.assertEqual(MOCK_DAILY_PRICE_RESPONSE, Decoder()(body))
+
+    def test_invalid_body(self):
+        with self.assertRaises(json.JSONDecodeError):
+            Decoder()(b'<html>')
+
+    def test_configure_decoder(self):
+        bodies = []
+        configure_decoder(lambda body: bodies.append(body) or {})
+
+        web.get(MockSession(MOCK_DAILY_PRICE_RESPONSE), {'symbol': 'MSFT'})
+
+        self.assertEqual(1, len(bodies))
+        self.assertIsInstance(bodies[0], bytes)
+
+    def test_get_decoder_argument(self):
+        data, _ = web.get(MockSession(MOCK_DAILY_PRICE_RESPONSE), {'symbol': 'MSFT'},
+                          decoder=Decoder(json.loads))
+
+        self.assertEqual(MOCK_DAILY_PRICE_RESPONSE, data)
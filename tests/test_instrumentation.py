@@ -0,0 +1,65 @@
+import json
+import os
+import tempfile
+import unittest
+
+from alphavantage.cache import ResponseCache
+from alphavantage.instrumentation import Instrumentation
+from alphavantage.price_history import PriceHistory
+from tests.fixtures import MOCK_DAILY_PRICE_RESPONSE, MockSession
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.metrics = []
+        self.instrumentation = Instrumentation(
+            lambda *metric: self.metrics.append(metric)
+        )
+
+    def test_emit(self):
+        Instrumentation().emit('request', 1.0)
+        self.instrumentation.emit('records', 3, 'MSFT')
+
+        self.assertEqual([('records', 3, 'MSFT')], self.metrics)
+
+    def test_timed(self):
+        with self.instrumentation.timed('sort', 'MSFT'):
+            pass
+
+        metric, seconds, ticker = self.metrics[0]
+
+        self.assertEqual(('sort', 'MSFT'), (metric, ticker))
+        self.assertGreaterEqual(seconds, 0)
+
+    def test_price_history_get(self):
+        history = PriceHistory(instrumentation=self.instrumentation)
+        history.session = MockSession(MOCK_DAILY_PRICE_RESPONSE)
+
+        history.get('MSFT')
+        metrics = {metric: value for metric, value, _ in self.metrics}
+
+        self.assertEqual({'MSFT'}, {ticker for _, _, ticker in self.metrics})
+        self.assertEqual(
+            {'rate_limit_wait', 'request', 'payload_bytes', 'decode',
+             'transform', 'timezone', 'sort', 'records'},
+            set(metrics)
+        )
+        self.assertEqual(2, metrics['records'])
+        self.assertEqual(len(json.dumps(MOCK_DAILY_PRICE_RESPONSE)),
+                         metrics['payload_bytes'])
+
+    def test_cache_hits(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResponseCache(os.path.join(directory, 'cache.db'),
+                                  clock=lambda: 0)
+            history = PriceHistory(cache=cache,
+                                   instrumentation=self.instrumentation)
+            history.session = MockSession(MOCK_DAILY_PRICE_RESPONSE)
+
+            history.get('MSFT')
+            history.get('MSFT')
+
+        hits = [value for metric, value, _ in self.metrics
+                if metric == 'cache_hit']
+
+        self.assertEqual([0, 1], hits)
@@ -0,0 +1,124 @@
+import unittest
+from datetime import date, datetime, time
+
+import pytz
+
+from alphavantage.planner import (
+    DEFAULT_CALENDARS, ExchangeCalendar, US_CALENDAR, plan_refreshes
+)
+from alphavantage.price_history import Results
+from alphavantage.symbology import FACTSET_EXCHANGE_TO_SUFFIX_MAP
+
+
+def results(updated_at, timezone='US/Eastern', retrieved_at=None):
+    return Results('T', [], timezone, updated_at, retrieved_at)
+
+
+class TestExchangeCalendar(unittest.TestCase):
+    def setUp(self):
+        self.calendar = ExchangeCalendar(
+            'US/Eastern', holidays=[date(2018, 5, 28)],
+            early_closes={date(2018, 7, 3): time(13, 0)}
+        )
+
+    def test_last_session_before_close(self):
+        now = datetime(2018, 5, 30, 19, 0, tzinfo=pytz.UTC)
+
+        self.assertEqual(date(2018, 5, 29), self.calendar.last_session(now))
+
+    def test_last_session_after_close(self):
+        now = datetime(2018, 5, 30, 20, 0, tzinfo=pytz.UTC)
+
+        self.assertEqual(date(2018, 5, 30), self.calendar.last_session(now))
+
+    def test_last_session_skips_weekend_and_holiday(self):
+        now = datetime(2018, 5, 29, 12, 0, tzinfo=pytz.UTC)
+
+        self.assertEqual(date(2018, 5, 25), self.calendar.last_session(now))
+
+    def test_early_close(self):
+        now = datetime(2018, 7, 3, 17, 30, tzinfo=pytz.UTC)
+
+        self.assertEqual(date(2018, 7, 3), self.calendar.last_session(now))
+
+    def test_count_sessions(self):
+        self.assertEqual(
+            2, self.calendar.count_sessions(date(2018, 5, 24), date(2018, 5, 29), 10)
+        )
+
+
+class TestPlanRefreshes(unittest.TestCase):
+    def setUp(self):
+        self.calendars = {
+            'NYS': ExchangeCalendar('US/Eastern', holidays=[date(2018, 5, 28)]),
+            'LON': ExchangeCalendar('Europe/London', close_time=time(16, 30)),
+        }
+        # Monday holiday in New York, after the London close
+        self.now = datetime(2018, 5, 28, 18, 0, tzinfo=pytz.UTC)
+
+    def plan(self, universe):
+        return plan_refreshes(universe, self.calendars, now=self.now)
+
+    def test_current_results_skipped(self):
+        fetches = self.plan([
+            ('MSFT', 'NYS', results(date(2018, 5, 25))),
+            ('VOD', 'LON', results(date(2018, 5, 28), 'Europe/London')),
+        ])
+
+        self.assertEqual([], fetches)
+
+    def test_stale_results_in_priority_order(self):
+        fetches = self.plan([
+            ('MSFT', 'NYS', results(date(2018, 5, 24))),
+            ('VOD', 'LON', results(date(2018, 5, 23), 'Europe/London')),
+            ('NEW', 'NYS', None),
+            ('OLD', 'NYS', results(date(2017, 1, 3))),
+        ])
+
+        self.assertEqual(['NEW', 'OLD', 'VOD', 'MSFT'],
+                         [fetch.ticker for fetch in fetches])
+        self.assertEqual(['full', 'full', 'compact', 'compact'],
+                         [fetch.output_size for fetch in fetches])
+        self.assertEqual([3, 1], [f.missed_sessions for f in fetches[2:]])
+
+    def test_intraday_updated_before_close(self):
+        fetches = plan_refreshes(
+            [('MSFT', 'NAS', results(datetime(2018, 5, 30, 19, 0, tzinfo=pytz.UTC))),
+             ('AAPL', 'NAS', results(datetime(2018, 5, 30, 16, 0)))],
+            now=datetime(2018, 5, 31, 12, 0, tzinfo=pytz.UTC)
+        )
+
+        self.assertEqual(['MSFT'], [fetch.ticker for fetch in fetches])
+
+    def test_daily_retrieved_before_close(self):
+        # Last Refreshed 2018-05-25 11:30:00, planned Friday evening
+        fetches = plan_refreshes(
+            [('MSFT', 'NAS', results(date(2018, 5, 25),
+                                     retrieved_at=datetime(2018, 5, 25, 15, 30))),
+             ('AAPL', 'NAS', results(date(2018, 5, 25),
+                                     retrieved_at=datetime(2018, 5, 25, 20, 5)))],
+            now=datetime(2018, 5, 26, 0, 0, tzinfo=pytz.UTC)
+        )
+
+        self.assertEqual(['MSFT'], [fetch.ticker for fetch in fetches])
+        self.assertEqual(1, fetches[0].missed_sessions)
+
+    def test_default_calendar(self):
+        self.assertEqual('US/Eastern', US_CALENDAR.timezone)
+        self.assertIs(US_CALENDAR, DEFAULT_CALENDARS['NYS'])
+        self.assertEqual(set(FACTSET_EXCHANGE_TO_SUFFIX_MAP),
+                         set(DEFAULT_CALENDARS))
+
+    def test_default_calendars_global(self):
+        # Friday after the London close, a weekend day for Tadawul
+        fetches = plan_refreshes(
+            [('VOD', 'LON', None),
+             ('2222', 'SAU', results(date(2018, 5, 31), 'Asia/Riyadh'))],
+            now=datetime(2018, 6, 1, 16, 0, tzinfo=pytz.UTC)
+        )
+
+        self.assertEqual(['VOD'], [fetch.ticker for fetch in fetches])
+
+    def test_missing_calendar(self):
+        with self.assertRaisesRegex(ValueError, "'XXX'"):
+            plan_refreshes([('T', 'XXX', None)])
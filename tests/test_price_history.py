@@ -1,16 +1,22 @@
+import copy
 import unittest
 from datetime import date, datetime
+from unittest import mock
 
 import pytz
 
 from alphavantage.dates import convert_to_utc
+from alphavantage.exceptions import InvalidRequestError
 from alphavantage.price_history import (
     AdjustedPriceHistory, build_field_names, get_time_series_function, FULL,
-    IntradayPriceHistory, PriceHistory, format_interval, Results
+    IntradayPriceHistory, PriceHistory, format_interval, merge_records, Results,
+    COMPACT, CSV, FanOut, get_outcomes, get_results
 )
+from alphavantage.results import ColumnarResults
 from tests.fixtures import (
     MOCK_META, MOCK_DAILY_RECORDS, MOCK_DAILY_PRICE_RESPONSE,
-    MOCK_ADJUSTED_RECORDS, MOCK_INTRADAY_RESPONSE
+    MOCK_ADJUSTED_RECORDS, MOCK_ADJUSTED_PRICE_RESPONSE, MOCK_INTRADAY_RESPONSE,
+    MOCK_DAILY_CSV, MOCK_ADJUSTED_CSV, MOCK_INTRADAY_CSV, MockSession
 )
 
 
@@ -107,6 +113,25 @@ class TestPriceHistory(unittest.TestCase):
 
         self.assertEqual(expected, result)
 
+    def test_sort_records_ascending(self):
+        records = self.transformed_records[::-1]
+
+        expected = list(records)
+        result = self.price_history.sort_records(iter(records))
+
+        self.assertEqual(expected, result)
+
+    def test_sort_records_unordered(self):
+        records = [{'as_of_date': date(2018, 5, d)} for d in (24, 22, 25, 23)]
+
+        expected = [{'as_of_date': date(2018, 5, d)} for d in (22, 23, 24, 25)]
+        result = self.price_history.sort_records(records)
+
+        self.assertEqual(expected, result)
+
+    def test_sort_records_empty(self):
+        self.assertEqual([], self.price_history.sort_records(iter([])))
+
     def test_transform_meta_data(self):
         expected = (self.updated_at, self.timezone, False)
         result = self.price_history.transform_meta_data(MOCK_META)
@@ -128,6 +153,17 @@ class TestPriceHistory(unittest.TestCase):
         self.assertEqual(expected.updated_at, result.updated_at)
         self.assertEqual(expected.records, result.records)
 
+    def test_get_results_removes_intraday_record(self):
+        response = copy.deepcopy(MOCK_DAILY_PRICE_RESPONSE)
+        response['Meta Data']['3. Last Refreshed'] = '2018-05-25 10:31:00'
+
+        expected = self.transformed_records[1:]
+        result = self.price_history.get_results(
+            self.ticker, response, datetime(2018, 5, 25, 14, 31, 0)
+        )
+
+        self.assertEqual(expected, result.records)
+
 
 class TestAdjustedPriceHistory(unittest.TestCase):
     def setUp(self):
@@ -233,3 +269,212 @@ class TestIntraDataPriceHistory(unittest.TestCase):
         self.assertEqual(expected.retrieved_at, result.retrieved_at)
         self.assertEqual(expected.updated_at, result.updated_at)
         self.assertEqual(expected.records, result.records)
+
+    def test_get_results_local_time(self):
+        price_history = IntradayPriceHistory(utc=False)
+        retrieved_at = datetime(2018, 5, 30, 9, 0, 30)
+
+        expected = [datetime(2018, 5, 30, 15, 58, 0),
+                    datetime(2018, 5, 30, 15, 59, 0),
+                    datetime(2018, 5, 30, 16, 0, 0)]
+        result = price_history.get_results(
+            self.ticker, MOCK_INTRADAY_RESPONSE, retrieved_at
+        )
+
+        self.assertEqual(expected, [r['as_of_time'] for r in result.records])
+
+
+class TestSync(unittest.TestCase):
+    def setUp(self):
+        self.ticker = 'MSFT'
+        self.retrieved_at = datetime(2018, 5, 25, 9, 0, 30)
+
+    def get_stored(self, history, response, start):
+        results = history.get_results(self.ticker, response, self.retrieved_at)
+        results.records = [r for r in results.records if r['as_of_date'] <= start]
+
+        return results
+
+    def sync(self, history, stored, response):
+        with mock.patch('alphavantage.web.get',
+                        return_value=(response, self.retrieved_at)) as get:
+            results = history.sync(self.ticker, stored)
+
+        output_sizes = [c[0][1]['outputsize'] for c in get.call_args_list]
+
+        return results, output_sizes
+
+    def test_merge_records(self):
+        records = [{'t': 1, 'v': 'a'}, {'t': 2, 'v': 'a'}, {'t': 3, 'v': 'a'}]
+        latest = [{'t': 2, 'v': 'b'}, {'t': 4, 'v': 'b'}]
+
+        expected = [{'t': 1, 'v': 'a'}, {'t': 2, 'v': 'b'}, {'t': 4, 'v': 'b'}]
+        result = merge_records(records, latest, 't')
+
+        self.assertEqual(expected, result)
+
+    def test_sync_merges_compact(self):
+        history = PriceHistory(output_size=FULL)
+        stored = self.get_stored(history, MOCK_DAILY_PRICE_RESPONSE,
+                                 date(2018, 5, 24))
+
+        results, output_sizes = self.sync(
+            history, stored, MOCK_DAILY_PRICE_RESPONSE
+        )
+        dates = [r['as_of_date'] for r in results.records]
+
+        self.assertEqual([COMPACT], output_sizes)
+        self.assertEqual([date(2018, 5, 24), date(2018, 5, 25)], dates)
+
+    def test_sync_gap_requests_full(self):
+        history = PriceHistory()
+        stored = self.get_stored(history, MOCK_DAILY_PRICE_RESPONSE,
+                                 date(2018, 5, 23))
+        stored.records = [{'as_of_date': date(2018, 5, 22)}]
+
+        _, output_sizes = self.sync(history, stored, MOCK_DAILY_PRICE_RESPONSE)
+
+        self.assertEqual([COMPACT, FULL], output_sizes)
+
+    def test_sync_new_dividend_requests_full(self):
+        history = AdjustedPriceHistory()
+        response = copy.deepcopy(MOCK_ADJUSTED_PRICE_RESPONSE)
+        response['Time Series (Daily)']['2018-05-25']['7. dividend amount'] = '0.42'
+        stored = self.get_stored(history, response, date(2018, 5, 24))
+
+        _, output_sizes = self.sync(history, stored, response)
+
+        self.assertEqual([COMPACT, FULL], output_sizes)
+
+    def test_sync_adjusted_without_events(self):
+        history = AdjustedPriceHistory()
+        stored = self.get_stored(history, MOCK_ADJUSTED_PRICE_RESPONSE,
+                                 date(2018, 5, 24))
+
+        results, output_sizes = self.sync(
+            history, stored, MOCK_ADJUSTED_PRICE_RESPONSE
+        )
+
+        self.assertEqual([COMPACT], output_sizes)
+        self.assertEqual(3, len(results.records))
+
+
+class TestSession(unittest.TestCase):
+    def test_close_owned_session(self):
+        with PriceHistory() as history:
+            session = history.session
+            history.session = MockSession()
+
+        self.assertTrue(history.session.closed)
+        session.close()
+
+    def test_shared_session_left_open(self):
+        session = MockSession()
+
+        with PriceHistory(session=session):
+            pass
+
+        self.assertFalse(session.closed)
+
+    def test_get_results_shares_session(self):
+        session = MockSession(payloads={
+            'MSFT': MOCK_DAILY_PRICE_RESPONSE,
+            'AAPL': MOCK_DAILY_PRICE_RESPONSE,
+            'FAKE': {'Error Message': 'Invalid API call.'}
+        })
+
+        with mock.patch('alphavantage.web.create_session',
+                        return_value=session) as create_session:
+            results = dict(get_results(PriceHistory, ['MSFT', 'AAPL', 'FAKE'],
+                                       {}, fan_out=FanOut(max_workers=2)))
+
+        create_session.assert_called_once_with(2, True)
+        self.assertEqual({'MSFT', 'AAPL'}, set(results))
+        self.assertEqual({'MSFT', 'AAPL', 'FAKE'},
+                         set(session.requested('symbol')))
+        self.assertTrue(session.closed)
+
+    def test_get_results_parses_in_processes(self):
+        session = MockSession(payloads={
+            'MSFT': MOCK_DAILY_PRICE_RESPONSE,
+            'FAKE': {'Error Message': 'Invalid API call.'}
+        })
+
+        with mock.patch('alphavantage.web.create_session',
+                        return_value=session):
+            outcomes = {
+                outcome.ticker: outcome for outcome in get_outcomes(
+                    PriceHistory, ['MSFT', 'FAKE'], {}, fan_out=FanOut(processes=2)
+                )
+            }
+
+        result = outcomes['MSFT'].results
+        expected = PriceHistory().get_results(
+            'MSFT', MOCK_DAILY_PRICE_RESPONSE, result.retrieved_at
+        )
+
+        self.assertIsInstance(result, ColumnarResults)
+        self.assertEqual(expected.records, list(result.records))
+        self.assertIsInstance(outcomes['FAKE'].error, InvalidRequestError)
+        self.assertTrue(session.closed)
+
+
+class TestCsv(unittest.TestCase):
+    def setUp(self):
+        self.retrieved_at = datetime(2018, 5, 31, 12, 0)
+
+    def assertResultsEqual(self, expected, result):
+        self.assertEqual(expected.records, result.records)
+        self.assertEqual(expected.updated_at, result.updated_at)
+        self.assertEqual(expected.timezone, result.timezone)
+
+    def get_results(self, cls, response, body, **parameters):
+        expected = cls(**parameters).get_results(
+            'MSFT', response, self.retrieved_at
+        )
+        result = cls(datatype=CSV, **parameters).parse_body(
+            'MSFT', body.encode(), self.retrieved_at
+        )
+
+        return expected, result
+
+    def test_request_parameters(self):
+        parameters = PriceHistory(datatype=CSV).request_parameters('MSFT')
+
+        self.assertEqual(CSV, parameters['datatype'])
+        self.assertNotIn('datatype', PriceHistory().request_parameters('MSFT'))
+
+    def test_daily(self):
+        self.assertResultsEqual(*self.get_results(
+            PriceHistory, MOCK_DAILY_PRICE_RESPONSE, MOCK_DAILY_CSV
+        ))
+
+    def test_adjusted(self):
+        self.assertResultsEqual(*self.get_results(
+            AdjustedPriceHistory, MOCK_ADJUSTED_PRICE_RESPONSE, MOCK_ADJUSTED_CSV
+        ))
+
+    def test_intraday(self):
+        for utc in (True, False):
+            self.assertResultsEqual(*self.get_results(
+                IntradayPriceHistory, MOCK_INTRADAY_RESPONSE, MOCK_INTRADAY_CSV,
+                utc=utc
+            ))
+
+    def test_partial_session_bar_removed(self):
+        retrieved_at = datetime(2018, 5, 25, 15, 0)
+
+        results = PriceHistory(datatype=CSV).get_csv_results(
+            'MSFT', MOCK_DAILY_CSV.splitlines(), retrieved_at
+        )
+
+        self.assertEqual([date(2018, 5, 24)],
+                         [r['as_of_date'] for r in results.records])
+        self.assertEqual(date(2018, 5, 25), results.updated_at)
+
+    def test_error_payload(self):
+        with self.assertRaises(InvalidRequestError):
+            PriceHistory(datatype=CSV).parse_body(
+                'MSFT', b'{\n    "Error Message": "Invalid API call."\n}',
+                self.retrieved_at
+            )
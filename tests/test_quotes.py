@@ -0,0 +1,84 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import pytz
+
+from alphavantage.exceptions import InvalidRequestError, ThrottledError
+from alphavantage.quotes import (
+    BatchQuotes, get_quote_outcomes, get_quotes, split_batches
+)
+from alphavantage.price_history import FanOut
+from alphavantage.retry import NO_RETRY
+from tests.fixtures import MOCK_BATCH_QUOTES_RESPONSE, MockSession
+
+
+class TestBatchQuotes(unittest.TestCase):
+    def setUp(self):
+        self.retrieved_at = datetime(2018, 5, 25, 20, 0, 5)
+
+    def test_split_batches(self):
+        expected = [('A', 'B'), ('C', 'D'), ('E',)]
+        result = split_batches(['A', 'B', 'C', 'D', 'E'], batch_size=2)
+
+        self.assertEqual(expected, result)
+
+    def test_request_parameters(self):
+        result = BatchQuotes(api_key='key').request_parameters(['MSFT', 'AAPL'])
+
+        self.assertEqual('BATCH_STOCK_QUOTES', result['function'])
+        self.assertEqual('MSFT,AAPL', result['symbols'])
+
+    def test_get_results(self):
+        results = BatchQuotes().get_results(MOCK_BATCH_QUOTES_RESPONSE,
+                                            self.retrieved_at)
+
+        expected = [{
+            'price': 98.36,
+            'volume': 18363918,
+            'as_of_time': datetime(2018, 5, 25, 20, 0, tzinfo=pytz.UTC),
+        }]
+
+        self.assertEqual({'MSFT', 'AAPL'}, set(results))
+        self.assertEqual(expected, results['MSFT'].records)
+        self.assertEqual(expected[0]['as_of_time'], results['MSFT'].updated_at)
+        self.assertEqual(self.retrieved_at, results['MSFT'].retrieved_at)
+        self.assertEqual('US/Eastern', results['MSFT'].timezone)
+        self.assertIsNone(results['AAPL'].records[0]['volume'])
+
+    def test_get_results_local_time(self):
+        results = BatchQuotes(utc=False).get_results(MOCK_BATCH_QUOTES_RESPONSE,
+                                                     self.retrieved_at)
+
+        self.assertEqual(datetime(2018, 5, 25, 16, 0),
+                         results['MSFT'].updated_at)
+
+    def test_throttled(self):
+        with self.assertRaises(ThrottledError):
+            BatchQuotes().get_results({'Note': 'Thank you'}, self.retrieved_at)
+
+    def test_get_quotes_in_batches(self):
+        session = MockSession(MOCK_BATCH_QUOTES_RESPONSE)
+
+        with mock.patch('alphavantage.web.create_session', return_value=session):
+            outcomes = {
+                outcome.ticker: outcome for outcome in get_quote_outcomes(
+                    ['MSFT', 'AAPL', 'FAKE'], batch_size=2,
+                    fan_out=FanOut(retry=NO_RETRY)
+                )
+            }
+
+        self.assertEqual({'MSFT,AAPL', 'FAKE'},
+                         set(session.requested('symbols')))
+        self.assertEqual(98.36, outcomes['MSFT'].results.records[0]['price'])
+        self.assertTrue(outcomes['AAPL'].ok)
+        self.assertIsInstance(outcomes['FAKE'].error, InvalidRequestError)
+
+    def test_get_quotes_skips_failed(self):
+        session = MockSession(MOCK_BATCH_QUOTES_RESPONSE)
+
+        with mock.patch('alphavantage.web.create_session', return_value=session):
+            results = dict(get_quotes(['MSFT', 'FAKE'],
+                                      fan_out=FanOut(retry=NO_RETRY)))
+
+        self.assertEqual({'MSFT'}, set(results))
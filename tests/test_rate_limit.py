@@ -0,0 +1,211 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from alphavantage.exceptions import ThrottledError
+from alphavantage.price_history import PriceHistory
+from alphavantage.rate_limit import DAY, MINUTE, CallWindow, KeyPool, RateLimiter
+from tests.fixtures import MOCK_DAILY_PRICE_RESPONSE, MockSession
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestCallWindow(unittest.TestCase):
+    def test_earliest_within_budget(self):
+        window = CallWindow(calls=2, period=60)
+        window.record(0)
+
+        self.assertEqual(10, window.earliest(10))
+
+    def test_earliest_over_budget(self):
+        window = CallWindow(calls=2, period=60)
+        window.record(0)
+        window.record(5)
+
+        self.assertEqual(60, window.earliest(10))
+
+    def test_expired_calls_dropped(self):
+        window = CallWindow(calls=1, period=60)
+        window.record(0)
+
+        self.assertEqual(61, window.earliest(61))
+        self.assertEqual(0, len(window.history))
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_unlimited(self):
+        limiter = RateLimiter(clock=self.clock, sleep=self.clock.sleep)
+
+        waits = [limiter.acquire() for _ in range(100)]
+
+        self.assertEqual([0] * 100, waits)
+        self.assertEqual([], self.clock.sleeps)
+
+    def test_paces_per_minute(self):
+        limiter = RateLimiter(calls_per_minute=5, clock=self.clock,
+                              sleep=self.clock.sleep)
+
+        waits = [limiter.acquire() for _ in range(11)]
+
+        self.assertEqual([0] * 5 + [60] + [0] * 4 + [60], waits)
+
+    def test_paces_per_day(self):
+        limiter = RateLimiter(calls_per_minute=5, calls_per_day=6,
+                              clock=self.clock, sleep=self.clock.sleep)
+
+        waits = [limiter.acquire() for _ in range(7)]
+
+        self.assertEqual([0] * 5 + [60, 24 * 60 * 60 - 60], waits)
+
+    def test_reserve_schedules_concurrent_callers(self):
+        limiter = RateLimiter(calls_per_minute=2, clock=self.clock)
+
+        delays = [limiter.reserve() for _ in range(5)]
+
+        self.assertEqual([0, 0, 60, 60, 120], delays)
+
+    def test_reserve_not_before(self):
+        limiter = RateLimiter(calls_per_minute=2, clock=self.clock)
+
+        delays = [limiter.reserve(not_before=30) for _ in range(3)]
+
+        self.assertEqual([30, 30, 90], delays)
+
+    def test_configure(self):
+        limiter = RateLimiter(calls_per_minute=1, clock=self.clock)
+        limiter.configure()
+
+        self.assertEqual([0, 0], [limiter.reserve(), limiter.reserve()])
+
+    def test_thread_safe(self):
+        limiter = RateLimiter(calls_per_minute=10, clock=self.clock)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            delays = list(executor.map(lambda _: limiter.reserve(), range(30)))
+
+        self.assertEqual([0] * 10 + [60] * 10 + [120] * 10, sorted(delays))
+
+
+MINUTE_NOTE = (
+    'Thank you for using Alpha Vantage! Our standard API call frequency is '
+    '5 calls per minute and 500 calls per day.'
+)
+
+
+def throttle_key(throttled):
+    def respond(params):
+        if params['apikey'] == throttled:
+            return {'Note': MINUTE_NOTE}
+
+        return MOCK_DAILY_PRICE_RESPONSE
+
+    return respond
+
+
+class TestKeyPool(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def create_pool(self, keys=('a', 'b'), **limits):
+        return KeyPool(keys, clock=self.clock, sleep=self.clock.sleep, **limits)
+
+    def test_spreads_calls_over_keys(self):
+        pool = self.create_pool(calls_per_minute=2)
+
+        reservations = [pool.reserve() for _ in range(6)]
+
+        self.assertEqual(
+            [('a', 0), ('b', 0), ('a', 0), ('b', 0), ('a', 60), ('b', 60)],
+            reservations
+        )
+        self.assertEqual({'a': 3, 'b': 3}, dict(pool.usage))
+
+    def test_prefers_key_with_most_budget(self):
+        pool = self.create_pool(calls_per_minute=5, calls_per_day=10)
+        pool.limiters['a'].reserve()
+        pool.limiters['a'].reserve()
+
+        self.assertEqual(['b', 'b', 'a'], [pool.reserve()[0] for _ in range(3)])
+
+    def test_rests_throttled_key(self):
+        pool = self.create_pool()
+        pool.throttled('a', ThrottledError(MINUTE_NOTE))
+
+        self.assertEqual(['b', 'b'], [pool.reserve()[0] for _ in range(2)])
+        self.assertEqual({'a': 1}, dict(pool.throttles))
+
+        self.clock.now = MINUTE
+
+        self.assertEqual('a', pool.reserve()[0])
+
+    def test_rests_exhausted_key_for_a_day(self):
+        pool = self.create_pool()
+        pool.throttled('a', ThrottledError('25 requests per day'))
+
+        self.assertEqual(DAY, pool.resting_until['a'])
+
+    def test_waits_when_all_keys_rest(self):
+        pool = self.create_pool(keys=['a'])
+        pool.throttled('a', ThrottledError(MINUTE_NOTE))
+
+        self.assertEqual(('a', MINUTE), pool.reserve())
+
+    def test_resting_key_paced_after_rest(self):
+        pool = self.create_pool(keys=['a'], calls_per_minute=2)
+        pool.throttled('a', ThrottledError(MINUTE_NOTE))
+
+        delays = [pool.reserve()[1] for _ in range(5)]
+
+        self.assertEqual([60, 60, 120, 120, 180], delays)
+
+    def test_lease_sets_key(self):
+        pool = self.create_pool()
+        parameters = {'apikey': 'demo'}
+
+        lease = pool.lease(parameters)
+
+        self.assertEqual(0, lease.acquire())
+        self.assertEqual('a', lease.key)
+        self.assertEqual('a', parameters['apikey'])
+
+
+class TestPriceHistoryKeyPool(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.pool = KeyPool(['a', 'b'], calls_per_minute=5, clock=self.clock,
+                            sleep=self.clock.sleep)
+
+    def test_requests_use_pooled_keys(self):
+        session = MockSession(MOCK_DAILY_PRICE_RESPONSE)
+        history = PriceHistory(session=session, key_pool=self.pool)
+
+        for _ in range(4):
+            history.get('MSFT')
+
+        self.assertEqual(['a', 'b', 'a', 'b'], session.requested('apikey'))
+
+    def test_throttled_key_rested(self):
+        session = MockSession(respond=throttle_key('a'))
+        history = PriceHistory(session=session, key_pool=self.pool)
+
+        with self.assertRaises(ThrottledError):
+            history.get('MSFT')
+
+        history.get('MSFT')
+        history.get('MSFT')
+
+        self.assertEqual(['a', 'b', 'b'], session.requested('apikey'))
+        self.assertEqual({'a': 1}, dict(self.pool.throttles))
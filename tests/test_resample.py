@@ -0,0 +1,116 @@
+import unittest
+from datetime import date, datetime
+
+import pytz
+
+from alphavantage.price_history import (
+    AdjustedPriceHistory, IntradayPriceHistory, Results
+)
+from alphavantage.reference import MONTHLY, WEEKLY
+from alphavantage.resample import resample_interval, resample_period
+from tests.fixtures import MOCK_ADJUSTED_PRICE_RESPONSE, MOCK_INTRADAY_RESPONSE
+
+
+def daily_record(day, open_, high, low, close, volume):
+    return {'as_of_date': day, 'open': open_, 'high': high, 'low': low,
+            'close': close, 'volume': volume}
+
+
+def minute_record(time, price, volume=100):
+    return {'as_of_time': time, 'open': price, 'high': price + 1,
+            'low': price - 1, 'close': price, 'volume': volume}
+
+
+class TestResamplePeriod(unittest.TestCase):
+    def setUp(self):
+        records = [
+            daily_record(date(2018, 5, 24), 10, 12, 9, 11, 100),
+            daily_record(date(2018, 5, 25), 11, 15, 10, 14, 200),
+            daily_record(date(2018, 5, 29), 14, 14, 8, 9, 300),
+            daily_record(date(2018, 6, 1), 9, 10, 7, 8, 400),
+        ]
+        self.results = Results('MSFT', records, 'US/Eastern',
+                               date(2018, 6, 1), None)
+
+    def test_weekly(self):
+        expected = [
+            daily_record(date(2018, 5, 25), 10, 15, 9, 14, 300),
+            daily_record(date(2018, 6, 1), 14, 14, 7, 8, 700),
+        ]
+        result = resample_period(self.results, WEEKLY)
+
+        self.assertEqual(expected, result.records)
+        self.assertEqual(self.results.updated_at, result.updated_at)
+
+    def test_monthly(self):
+        expected = [
+            daily_record(date(2018, 5, 29), 10, 15, 8, 9, 600),
+            daily_record(date(2018, 6, 1), 9, 10, 7, 8, 400),
+        ]
+        result = resample_period(self.results, MONTHLY)
+
+        self.assertEqual(expected, result.records)
+
+    def test_adjusted_fields(self):
+        results = AdjustedPriceHistory().get_results(
+            'MSFT', MOCK_ADJUSTED_PRICE_RESPONSE, None
+        )
+
+        bar, = resample_period(results, WEEKLY).records
+
+        self.assertEqual(98.36, bar['adjusted_close'])
+        self.assertEqual(0, bar['dividend_amount'])
+        self.assertEqual(1, bar['split_coefficient'])
+        self.assertEqual(17942632 + 26649287 + 21251222, bar['volume'])
+
+
+class TestResampleInterval(unittest.TestCase):
+    def get_results(self, times):
+        records = [minute_record(t, i) for i, t in enumerate(times)]
+
+        return Results('MSFT', records, 'US/Eastern', times[-1], None)
+
+    def test_bars_end_on_interval_from_open(self):
+        results = self.get_results([
+            datetime(2018, 5, 30, 9, 31), datetime(2018, 5, 30, 9, 45),
+            datetime(2018, 5, 30, 9, 46), datetime(2018, 5, 30, 10, 0),
+        ])
+
+        result = resample_interval(results, 15).records
+
+        self.assertEqual(
+            [datetime(2018, 5, 30, 9, 45), datetime(2018, 5, 30, 10, 0)],
+            [r['as_of_time'] for r in result]
+        )
+        self.assertEqual([0, 2], [r['open'] for r in result])
+        self.assertEqual([1, 3], [r['close'] for r in result])
+        self.assertEqual([-1, 1], [r['low'] for r in result])
+        self.assertEqual([200, 200], [r['volume'] for r in result])
+
+    def test_last_bar_ends_at_close(self):
+        results = self.get_results([
+            datetime(2018, 5, 30, 15, 30), datetime(2018, 5, 30, 15, 31),
+            datetime(2018, 5, 30, 16, 0),
+            datetime(2018, 5, 31, 9, 31),
+        ])
+
+        result = resample_interval(results, 60).records
+
+        self.assertEqual(
+            [datetime(2018, 5, 30, 15, 30), datetime(2018, 5, 30, 16, 0),
+             datetime(2018, 5, 31, 10, 30)],
+            [r['as_of_time'] for r in result]
+        )
+
+    def test_utc_times_use_exchange_sessions(self):
+        results = IntradayPriceHistory().get_results(
+            'MSFT', MOCK_INTRADAY_RESPONSE, None
+        )
+
+        bar, = resample_interval(results, 30).records
+
+        self.assertEqual(datetime(2018, 5, 30, 20, 0, tzinfo=pytz.UTC),
+                         bar['as_of_time'])
+        self.assertEqual(98.99, bar['open'])
+        self.assertEqual(98.95, bar['close'])
+        self.assertEqual(2233252 + 156349 + 142621, bar['volume'])
@@ -0,0 +1,245 @@
+import pickle
+import threading
+import time
+import unittest
+from array import array
+from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from alphavantage.price_history import (
+    AdjustedPriceHistory, IntradayPriceHistory, PriceHistory
+)
+from alphavantage.results import ColumnarResults, LazyResults, Results
+from tests.fixtures import (
+    MOCK_ADJUSTED_PRICE_RESPONSE, MOCK_DAILY_PRICE_RESPONSE,
+    MOCK_INTRADAY_RESPONSE
+)
+
+
+class TestColumnarResults(unittest.TestCase):
+    def setUp(self):
+        self.retrieved_at = datetime(2018, 5, 30, 9, 0, 30)
+
+    def get_results(self, cls, response, **parameters):
+        expected = cls(**parameters).get_results(
+            'MSFT', response, self.retrieved_at
+        )
+        result = cls(columnar=True, **parameters).get_results(
+            'MSFT', response, self.retrieved_at
+        )
+
+        return expected, result
+
+    def test_daily_records(self):
+        expected, result = self.get_results(
+            PriceHistory, MOCK_DAILY_PRICE_RESPONSE
+        )
+
+        self.assertIsInstance(result, ColumnarResults)
+        self.assertEqual(expected.records, list(result.records))
+        self.assertEqual(expected.updated_at, result.updated_at)
+
+    def test_adjusted_records(self):
+        expected, result = self.get_results(
+            AdjustedPriceHistory, MOCK_ADJUSTED_PRICE_RESPONSE
+        )
+
+        self.assertEqual(expected.records, list(result.records))
+
+    def test_intraday_records(self):
+        for utc in (True, False):
+            expected, result = self.get_results(
+                IntradayPriceHistory, MOCK_INTRADAY_RESPONSE, utc=utc
+            )
+
+            self.assertEqual(expected.records, list(result.records))
+
+    def test_record_access(self):
+        expected, result = self.get_results(
+            IntradayPriceHistory, MOCK_INTRADAY_RESPONSE
+        )
+
+        self.assertEqual(len(expected.records), len(result.records))
+        self.assertEqual(expected.records[-1], result.records[-1])
+        self.assertEqual(expected.records[1:], result.records[1:])
+        self.assertEqual(expected.records, result.records)
+
+        with self.assertRaises(IndexError):
+            result.records[3]
+
+    def test_column(self):
+        expected, result = self.get_results(
+            PriceHistory, MOCK_DAILY_PRICE_RESPONSE
+        )
+
+        self.assertEqual(array('d', [98.31, 98.36]), result.column('close'))
+        self.assertEqual(array('q', [26649287, 18363918]),
+                         result.column('volume'))
+        self.assertEqual([r['as_of_date'] for r in expected.records],
+                         result.column('as_of_date'))
+
+    def test_empty(self):
+        result = ColumnarResults.from_records(
+            'MSFT', [], 'as_of_date', 'US/Eastern', None, self.retrieved_at
+        )
+
+        self.assertEqual([], list(result.records))
+
+    def test_pickle(self):
+        _, result = self.get_results(IntradayPriceHistory, MOCK_INTRADAY_RESPONSE)
+
+        loaded = pickle.loads(pickle.dumps(result))
+
+        self.assertEqual(list(result.records), list(loaded.records))
+
+
+class TestLazyResults(unittest.TestCase):
+    def setUp(self):
+        self.retrieved_at = datetime(2018, 5, 30, 9, 0, 30)
+
+    def get_results(self, cls, response, **parameters):
+        expected = cls(**parameters).get_results(
+            'MSFT', response, self.retrieved_at
+        )
+        result = cls(lazy=True, **parameters).get_results(
+            'MSFT', response, self.retrieved_at
+        )
+
+        return expected, result
+
+    def test_records_transformed_on_access(self):
+        history = IntradayPriceHistory(lazy=True)
+
+        with mock.patch.object(history, 'transform_record',
+                               wraps=history.transform_record) as transform:
+            result = history.get_results('MSFT', MOCK_INTRADAY_RESPONSE,
+                                         self.retrieved_at)
+
+            self.assertIsInstance(result, LazyResults)
+            self.assertEqual(0, transform.call_count)
+            self.assertEqual(3, len(result.records))
+            self.assertEqual(3, transform.call_count)
+
+    def test_same_records(self):
+        for cls, response in (
+            (PriceHistory, MOCK_DAILY_PRICE_RESPONSE),
+            (AdjustedPriceHistory, MOCK_ADJUSTED_PRICE_RESPONSE),
+            (IntradayPriceHistory, MOCK_INTRADAY_RESPONSE),
+        ):
+            expected, result = self.get_results(cls, response)
+
+            self.assertEqual(expected.records, result.records)
+            self.assertEqual(expected.updated_at, result.updated_at)
+            self.assertEqual(expected.timezone, result.timezone)
+
+    def test_latest(self):
+        expected, result = self.get_results(IntradayPriceHistory,
+                                            MOCK_INTRADAY_RESPONSE)
+
+        self.assertEqual(expected.records[-1:], result.latest())
+        self.assertEqual(expected.records[-2:], result.latest(2))
+        self.assertIsNotNone(result.series)
+
+        result.records
+
+        self.assertEqual(expected.records[-2:], result.latest(2))
+
+    def test_concurrent_first_access(self):
+        calls = []
+        barrier = threading.Barrier(4)
+
+        def transform(items):
+            calls.append(threading.current_thread())
+            time.sleep(0.05)
+
+            return sorted(items)
+
+        result = LazyResults('MSFT', {'b': 2, 'a': 1}, transform, 'US/Eastern',
+                             None, self.retrieved_at)
+
+        def access(_):
+            barrier.wait(5)
+
+            return result.records, result.latest()
+
+        with ThreadPoolExecutor(4) as executor:
+            accessed = list(executor.map(access, range(4)))
+
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(records is accessed[0][0] for records, _ in accessed))
+
+    def test_latest_removes_partial_session(self):
+        response = dict(MOCK_DAILY_PRICE_RESPONSE, **{
+            'Meta Data': dict(MOCK_DAILY_PRICE_RESPONSE['Meta Data'], **{
+                '3. Last Refreshed': '2018-05-25 11:00:00'
+            })
+        })
+        expected, result = self.get_results(PriceHistory, response)
+
+        self.assertEqual(expected.records[-1:], result.latest())
+        self.assertEqual(date(2018, 5, 24), result.latest()[0]['as_of_date'])
+
+
+class TestTimeIndex(unittest.TestCase):
+    def setUp(self):
+        retrieved_at = datetime(2018, 5, 31, 9, 0)
+        self.daily = AdjustedPriceHistory().get_results(
+            'MSFT', MOCK_ADJUSTED_PRICE_RESPONSE, retrieved_at
+        )
+        self.columnar = AdjustedPriceHistory(columnar=True).get_results(
+            'MSFT', MOCK_ADJUSTED_PRICE_RESPONSE, retrieved_at
+        )
+        self.intraday = IntradayPriceHistory(utc=False).get_results(
+            'MSFT', MOCK_INTRADAY_RESPONSE, retrieved_at
+        )
+
+    def test_between(self):
+        for results in (self.daily, self.columnar):
+            result = results.between(date(2018, 5, 24), date(2018, 5, 24))
+
+            self.assertEqual(results.records[1:2], list(result.records))
+            self.assertEqual(results.records[1:],
+                             list(results.between(date(2018, 5, 24)).records))
+            self.assertEqual(results.records[:1],
+                             list(results.between(end=date(2018, 5, 23)).records))
+
+    def test_as_of(self):
+        for results in (self.daily, self.columnar):
+            self.assertIsNone(results.as_of(date(2018, 5, 22)))
+            self.assertEqual(results.records[1], results.as_of(date(2018, 5, 24)))
+            self.assertEqual(results.records[2], results.as_of(date(2018, 6, 1)))
+
+        self.assertEqual(self.intraday.records[0],
+                         self.intraday.as_of(datetime(2018, 5, 30, 15, 58, 30)))
+
+    def test_nearest(self):
+        results = self.intraday
+
+        self.assertEqual(results.records[1],
+                         results.nearest(datetime(2018, 5, 30, 15, 58, 45)))
+        self.assertEqual(results.records[0],
+                         results.nearest(datetime(2018, 5, 30, 15, 58, 30)))
+        self.assertEqual(results.records[2],
+                         results.nearest(datetime(2018, 5, 31)))
+        self.assertEqual(self.columnar.records[0],
+                         self.columnar.nearest(date(2018, 1, 1)))
+
+    def test_records_reassigned(self):
+        results = self.daily
+        results.as_of(date(2018, 5, 24))
+        results.records = [
+            dict(record, as_of_date=date(2019, 1, day))
+            for day, record in enumerate(results.records, 1)
+        ]
+
+        self.assertEqual(results.records[1], results.as_of(date(2019, 1, 2)))
+        self.assertEqual(results.records[1:],
+                         results.between(date(2019, 1, 2)).records)
+
+    def test_empty(self):
+        results = Results('MSFT', [], 'US/Eastern', None, None)
+
+        self.assertIsNone(results.as_of(date(2018, 5, 24)))
+        self.assertIsNone(results.nearest(date(2018, 5, 24)))
+        self.assertEqual([], results.between(date(2018, 5, 24)).records)
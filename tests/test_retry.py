@@ -0,0 +1,141 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from json import JSONDecodeError
+
+import requests
+
+from alphavantage.exceptions import (
+    InvalidRequestError, ThrottledError, check_response
+)
+from alphavantage.retry import (
+    NO_RETRY, RetryPolicy, is_transient, run_with_retries
+)
+
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+
+    return requests.HTTPError(response=response)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestCheckResponse(unittest.TestCase):
+    def test_data(self):
+        check_response({'Meta Data': {}, 'Time Series (Daily)': {}})
+
+    def test_throttled(self):
+        for key in ('Note', 'Information'):
+            with self.assertRaises(ThrottledError):
+                check_response({key: 'Thank you for using Alpha Vantage!'})
+
+    def test_invalid(self):
+        with self.assertRaises(InvalidRequestError):
+            check_response({'Error Message': 'Invalid API call.'})
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_is_transient(self):
+        transient = [ThrottledError(), requests.Timeout(),
+                     requests.ConnectionError(), http_error(503),
+                     http_error(429), JSONDecodeError('', '', 0)]
+        permanent = [InvalidRequestError(), http_error(404), KeyError()]
+
+        self.assertTrue(all(map(is_transient, transient)))
+        self.assertFalse(any(map(is_transient, permanent)))
+
+    def test_delay(self):
+        policy = RetryPolicy(base_delay=2, max_delay=10, jitter=lambda: 1)
+
+        self.assertEqual([2, 4, 8, 10], [policy.delay(a) for a in range(1, 5)])
+
+    def test_throttled_delay(self):
+        policy = RetryPolicy(base_delay=2, jitter=lambda: 1)
+
+        self.assertEqual(62, policy.delay(1, ThrottledError()))
+        self.assertEqual(2, policy.delay(1, requests.Timeout()))
+
+    def test_delay_jitter(self):
+        policy = RetryPolicy(base_delay=2, jitter=lambda: 0)
+
+        self.assertEqual(2, policy.delay(2))
+
+    def test_should_retry(self):
+        policy = RetryPolicy(max_attempts=2)
+
+        self.assertTrue(policy.should_retry(ThrottledError(), 1))
+        self.assertFalse(policy.should_retry(ThrottledError(), 2))
+        self.assertFalse(policy.should_retry(InvalidRequestError(), 1))
+
+
+class TestRunWithRetries(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.calls = []
+
+    def run_tickers(self, function, tickers, policy):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            outcomes = run_with_retries(executor, function, tickers, policy,
+                                        clock=self.clock, sleep=self.clock.sleep)
+
+            return {outcome.ticker: outcome for outcome in outcomes}
+
+    def flaky(self, ticker):
+        self.calls.append(ticker)
+
+        if ticker == 'FAKE':
+            raise InvalidRequestError('Invalid API call.')
+
+        if ticker == 'BUSY' and self.calls.count(ticker) < 3:
+            raise ThrottledError('Thank you for using Alpha Vantage!')
+
+        return ticker.lower()
+
+    def test_requeues_transient(self):
+        policy = RetryPolicy(jitter=lambda: 1)
+
+        outcomes = self.run_tickers(self.flaky, ['MSFT', 'BUSY', 'FAKE'], policy)
+
+        self.assertEqual('msft', outcomes['MSFT'].results)
+        self.assertEqual(('busy', 3), (outcomes['BUSY'].results,
+                                       outcomes['BUSY'].attempts))
+        self.assertIsInstance(outcomes['FAKE'].error, InvalidRequestError)
+        self.assertEqual(1, outcomes['FAKE'].attempts)
+        self.assertEqual(1, self.calls.count('FAKE'))
+        self.assertEqual(2 * 60 + 3, self.clock.now)
+
+    def test_outlasts_throttle_window(self):
+        def throttled_for_a_minute(ticker):
+            if self.clock.now < 60:
+                raise ThrottledError('Thank you for using Alpha Vantage!')
+
+            return ticker.lower()
+
+        outcomes = self.run_tickers(throttled_for_a_minute, ['MSFT'],
+                                    RetryPolicy())
+
+        self.assertTrue(outcomes['MSFT'].ok)
+        self.assertEqual(2, outcomes['MSFT'].attempts)
+
+    def test_gives_up(self):
+        outcomes = self.run_tickers(self.flaky, ['BUSY'], NO_RETRY)
+
+        self.assertFalse(outcomes['BUSY'].ok)
+        self.assertIsInstance(outcomes['BUSY'].error, ThrottledError)
+
+    def test_other_errors_propagate(self):
+        def fail(ticker):
+            raise ZeroDivisionError
+
+        with self.assertRaises(ZeroDivisionError):
+            self.run_tickers(fail, ['MSFT'], NO_RETRY)
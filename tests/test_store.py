@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+
+from alphavantage.price_history import (
+    AdjustedPriceHistory, IntradayPriceHistory, PriceHistory
+)
+from alphavantage.store import HEADER_SIZE, PriceStore
+from tests.fixtures import (
+    MOCK_ADJUSTED_PRICE_RESPONSE, MOCK_DAILY_PRICE_RESPONSE,
+    MOCK_INTRADAY_RESPONSE
+)
+
+
+class TestPriceStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = PriceStore(self.directory.name)
+        self.retrieved_at = datetime(2018, 5, 30, 9, 0, 30)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def get_results(self, history, response):
+        return history.get_results('MSFT', response, self.retrieved_at)
+
+    def test_load_missing(self):
+        self.assertIsNone(self.store.load(PriceHistory(), 'MSFT'))
+
+    def test_save_load(self):
+        for history, response in (
+            (PriceHistory(), MOCK_DAILY_PRICE_RESPONSE),
+            (AdjustedPriceHistory(), MOCK_ADJUSTED_PRICE_RESPONSE),
+            (IntradayPriceHistory(), MOCK_INTRADAY_RESPONSE),
+            (IntradayPriceHistory(utc=False), MOCK_INTRADAY_RESPONSE),
+        ):
+            expected = self.get_results(history, response)
+            self.store.save(history, expected)
+
+            result = self.store.load(history, 'MSFT')
+
+            self.assertEqual(expected.records, list(result.records))
+            self.assertEqual(expected.updated_at, result.updated_at)
+            self.assertEqual(expected.retrieved_at, result.retrieved_at)
+            self.assertEqual(expected.timezone, result.timezone)
+
+    def test_columns_are_memory_mapped(self):
+        history = PriceHistory()
+        self.store.save(history, self.get_results(history, MOCK_DAILY_PRICE_RESPONSE))
+
+        result = self.store.load(history, 'MSFT')
+
+        self.assertIsInstance(result.column('close'), memoryview)
+        self.assertEqual([98.31, 98.36], list(result.column('close')))
+        self.assertEqual([26649287, 18363918], list(result.column('volume')))
+
+    def test_path_by_function_and_interval(self):
+        daily = self.store.path(PriceHistory(), 'msft')
+        intraday = self.store.path(IntradayPriceHistory(interval=5), 'MSFT')
+
+        self.assertEqual(
+            os.path.join(self.directory.name, 'TIME_SERIES_DAILY', 'MSFT.bin'),
+            daily
+        )
+        self.assertEqual(
+            os.path.join(self.directory.name, 'TIME_SERIES_INTRADAY_5min',
+                         'MSFT.bin'),
+            intraday
+        )
+
+    def test_append_newer_records(self):
+        history = PriceHistory()
+        results = self.get_results(history, MOCK_DAILY_PRICE_RESPONSE)
+        first = results.records[:1]
+        self.store.save(history, type(results)(
+            'MSFT', first, results.timezone, first[0]['as_of_date'], None
+        ))
+
+        self.store.append(history, results)
+        self.store.append(history, results)
+
+        result = self.store.load(history, 'MSFT')
+
+        self.assertEqual(results.records, list(result.records))
+        self.assertEqual(results.updated_at, result.updated_at)
+
+    def test_append_drops_partial_row(self):
+        history = PriceHistory()
+        results = self.get_results(history, MOCK_DAILY_PRICE_RESPONSE)
+        self.store.append(history, results)
+        path = self.store.path(history, 'MSFT')
+
+        with open(path, 'ab') as file:
+            file.write(b'\0' * 3)
+
+        self.store.append(history, results)
+
+        self.assertEqual(results.records,
+                         list(self.store.load(history, 'MSFT').records))
+        self.assertEqual(HEADER_SIZE + 2 * 6 * 8, os.path.getsize(path))
+
+    def test_append_mismatched_fields(self):
+        history = PriceHistory()
+        self.store.save(history, self.get_results(history, MOCK_DAILY_PRICE_RESPONSE))
+        adjusted = self.get_results(AdjustedPriceHistory(),
+                                    MOCK_ADJUSTED_PRICE_RESPONSE)
+
+        with self.assertRaises(ValueError):
+            self.store.append(history, adjusted)
+
+    def test_append_keeps_stored_header(self):
+        history = IntradayPriceHistory()
+        results = self.get_results(history, MOCK_INTRADAY_RESPONSE)
+        self.store.save(history, results)
+
+        self.store.append(history, type(results)(
+            'MSFT', [], results.timezone, None, self.retrieved_at
+        ))
+
+        result = self.store.load(history, 'MSFT')
+
+        self.assertEqual(results.records, list(result.records))
+        self.assertEqual(results.updated_at, result.updated_at)
+
+    def test_append_mismatched_utc(self):
+        history = IntradayPriceHistory()
+        self.store.save(history, self.get_results(history, MOCK_INTRADAY_RESPONSE))
+        local = self.get_results(IntradayPriceHistory(utc=False),
+                                 MOCK_INTRADAY_RESPONSE)
+
+        with self.assertRaises(ValueError):
+            self.store.append(history, local)
+
+    def test_between(self):
+        history = PriceHistory()
+        self.store.save(history, self.get_results(history, MOCK_DAILY_PRICE_RESPONSE))
+        stored = self.store.load(history, 'MSFT')
+
+        result = stored.between(date(2018, 5, 25), date(2018, 6, 30))
+
+        self.assertEqual(stored.records[1:], list(result.records))
+        self.assertEqual([], list(stored.between(end=date(2018, 1, 1)).records))
@@ -0,0 +1,96 @@
+import json
+import unittest
+from datetime import datetime
+
+from alphavantage.exceptions import ThrottledError
+from alphavantage.price_history import IntradayPriceHistory, PriceHistory
+from alphavantage.streaming import ResponseStream
+from tests.fixtures import MOCK_DAILY_PRICE_RESPONSE, MOCK_INTRADAY_RESPONSE
+
+
+def chunk(payload, size, indent=4):
+    body = json.dumps(payload, indent=indent, ensure_ascii=False).encode()
+
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class TestResponseStream(unittest.TestCase):
+    def test_items(self):
+        payload = {'a': 1, 'b': [1, 2], 'c': {'d': 'é'}}
+
+        for size in (1, 3, 1024):
+            result = dict(ResponseStream(chunk(payload, size)))
+
+            self.assertEqual(payload, result)
+
+    def test_series_items(self):
+        series_key = 'Time Series (Daily)'
+
+        for size in (1, 5, 1024):
+            stream = ResponseStream(chunk(MOCK_DAILY_PRICE_RESPONSE, size),
+                                    [series_key])
+            result = {
+                key: dict(value) if key == series_key else value
+                for key, value in stream
+            }
+
+            self.assertEqual(MOCK_DAILY_PRICE_RESPONSE, result)
+
+    def test_unconsumed_series_skipped(self):
+        payload = {'Series': {'a': {'x': 1}, 'b': {'x': 2}}, 'After': 3}
+        stream = ResponseStream(chunk(payload, 2, indent=None), ['Series'])
+
+        result = [key for key, _ in stream]
+
+        self.assertEqual(['Series', 'After'], result)
+
+    def test_empty_series(self):
+        payload = {'Series': {}, 'After': 3}
+        stream = ResponseStream(chunk(payload, 4), ['Series'])
+
+        result = [(key, list(value)) if key == 'Series' else (key, value)
+                  for key, value in stream]
+
+        self.assertEqual([('Series', []), ('After', 3)], result)
+
+    def test_truncated(self):
+        body = json.dumps(MOCK_DAILY_PRICE_RESPONSE).encode()[:-10]
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(ResponseStream([body]))
+
+
+class TestStreamResults(unittest.TestCase):
+    def setUp(self):
+        self.retrieved_at = datetime(2018, 5, 30, 9, 0, 30)
+
+    def assert_same_results(self, history, payload):
+        expected = history.get_results('MSFT', payload, self.retrieved_at)
+
+        for size in (7, 64 * 1024):
+            result = history.get_stream_results(
+                'MSFT', chunk(payload, size), self.retrieved_at
+            )
+
+            self.assertEqual(expected.records, result.records)
+            self.assertEqual(expected.updated_at, result.updated_at)
+            self.assertEqual(expected.timezone, result.timezone)
+
+    def test_daily(self):
+        self.assert_same_results(PriceHistory(), MOCK_DAILY_PRICE_RESPONSE)
+
+    def test_intraday(self):
+        self.assert_same_results(IntradayPriceHistory(), MOCK_INTRADAY_RESPONSE)
+
+    def test_meta_data_after_series(self):
+        payload = dict(reversed(list(MOCK_DAILY_PRICE_RESPONSE.items())))
+
+        self.assert_same_results(PriceHistory(), payload)
+
+    def test_throttle_payload(self):
+        payload = {'Note': 'Thank you for using Alpha Vantage!'}
+
+        with self.assertRaises(ThrottledError):
+            PriceHistory().get_stream_results(
+                'MSFT', chunk(payload, 16), self.retrieved_at
+            )
@@ -1,6 +1,9 @@
 import unittest
 
-from alphavantage.symbology import format_ric_ticker
+from alphavantage.symbology import (
+    format_ric_ticker, format_ric_tickers, get_factset_exchanges,
+    parse_ric_ticker, parse_ric_tickers
+)
 
 
 class TestFormatRicTicker(unittest.TestCase):
@@ -15,3 +18,28 @@ class TestFormatRicTicker(unittest.TestCase):
         result = format_ric_ticker('VOD', 'LON')
 
         self.assertEqual(expected, result)
+
+
+class TestParseRicTicker(unittest.TestCase):
+    def test_foreign_ticker(self):
+        self.assertEqual(('VOD', 'L'), parse_ric_ticker('VOD.L'))
+
+    def test_domestic_ticker(self):
+        self.assertEqual(('AAPL', None), parse_ric_ticker('AAPL'))
+
+    def test_share_class_kept(self):
+        self.assertEqual(('BRK.B', None), parse_ric_ticker('BRK.B'))
+
+    def test_factset_exchanges(self):
+        self.assertEqual(('LON',), get_factset_exchanges('VOD.L'))
+        self.assertEqual(('NAS', 'NYS', 'OTC'), get_factset_exchanges('AAPL'))
+
+    def test_round_trip(self):
+        tickers = ['VOD', 'AAPL', 'RY']
+        exchange_codes = ['LON', 'NAS', 'TSE']
+
+        rics = format_ric_tickers(tickers, exchange_codes)
+
+        self.assertEqual(['VOD.L', 'AAPL', 'RY.TO'], rics)
+        self.assertEqual([('VOD', 'L'), ('AAPL', None), ('RY', 'TO')],
+                         parse_ric_tickers(rics))
@@ -0,0 +1,16 @@
+import unittest
+
+from alphavantage.web import create_session
+
+
+class TestCreateSession(unittest.TestCase):
+    def test_pool_size(self):
+        with create_session(pool_size=16) as session:
+            adapter = session.get_adapter('https://www.alphavantage.co/query')
+
+            self.assertEqual(16, adapter._pool_maxsize)
+            self.assertEqual('keep-alive', session.headers['Connection'])
+
+    def test_no_keep_alive(self):
+        with create_session(keep_alive=False) as session:
+            self.assertEqual('close', session.headers['Connection'])